@@ -6,7 +6,33 @@ from __future__ import annotations
 
 from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
+from pandas.api.typing import DataFrameGroupBy
+
+
+def make_group_codes(df: pd.DataFrame, cols: Iterable[str]) -> tuple[np.ndarray, pd.DataFrame]:
+    """
+    Factorize a set of key columns into dense integer group codes.
+
+    Each column is factorized on its own (missing values form their own group) and folded into a
+    running int64 key that is re-factorized after every column, so hashing stays on integers instead
+    of mixed-dtype tuples and the key never grows past ``rows * uniques`` (no int64 overflow).
+    Codes are numbered in order of first appearance.
+
+    Returns
+    -------
+    tuple[np.ndarray, pd.DataFrame]
+        Group code per row, and a frame of the unique key combinations indexed by code.
+    """
+    cols = list(cols)
+    codes = np.zeros(len(df), dtype=np.int64)
+    for col in cols:
+        col_codes, col_uniques = pd.factorize(df[col], use_na_sentinel=False)
+        codes, _ = pd.factorize(codes * max(len(col_uniques), 1) + col_codes)
+    _, first_rows = np.unique(codes, return_index=True)
+    uniques = df[cols].iloc[first_rows].reset_index(drop=True)
+    return codes, uniques
 
 
 def aggregate_team_season(
@@ -51,11 +77,12 @@ def aggregate_team_season(
     if missing_metrics:
         raise ValueError(f"Cannot aggregate metrics; missing columns: {missing_metrics}")
 
-    grouped = df.groupby(list(group_cols), dropna=False)
-    agg_df = grouped.agg(metrics).reset_index()
-    games_played = grouped.size().reset_index(name="GAMES_PLAYED")
-
-    agg_df = agg_df.merge(games_played, on=list(group_cols), how="left")
+    group_cols = list(group_cols)
+    codes, keys = make_group_codes(df, group_cols)
+    grouped = df.groupby(codes, sort=True)
+    agg_df = pd.concat([keys, _aggregate_metrics(grouped, metrics).reset_index(drop=True)], axis=1)
+    agg_df["GAMES_PLAYED"] = grouped.size().to_numpy()
+    agg_df = agg_df.sort_values(group_cols, na_position="last", ignore_index=True)
     agg_df = agg_df.rename(
         columns={
             "WIN": "WIN_PCT",
@@ -70,6 +97,25 @@ def aggregate_team_season(
     return agg_df
 
 
+def _aggregate_metrics(grouped: DataFrameGroupBy, metrics: dict[str, str]) -> pd.DataFrame:
+    """
+    Apply a column -> aggregation mapping with one column-subset call per distinct function.
+
+    ``grouped[cols].mean()``-style calls stay on pandas' vectorized Cython kernels, whereas a
+    mixed dict passed to ``agg`` dispatches column by column.
+    """
+    columns_by_func: dict[str, list[str]] = {}
+    for column, func in metrics.items():
+        columns_by_func.setdefault(func, []).append(column)
+
+    if len(columns_by_func) == 1:
+        func, columns = next(iter(columns_by_func.items()))
+        return grouped[columns].agg(func)
+
+    parts = [grouped[columns].agg(func) for func, columns in columns_by_func.items()]
+    return pd.concat(parts, axis=1)[list(metrics)]
+
+
 def aggregate_player_season(
     df: pd.DataFrame,
     *,
@@ -99,9 +145,6 @@ def aggregate_player_season(
     if missing:
         raise ValueError(f"Missing required columns for player aggregation: {missing}")
 
-    agg_df = (
-        df.groupby([player_id_col, season_col, playoff_col], dropna=False)
-        .agg(metrics)
-        .reset_index()
-    )
+    grouped = df.groupby([player_id_col, season_col, playoff_col], dropna=False, observed=True)
+    agg_df = _aggregate_metrics(grouped, metrics).reset_index()
     return agg_df
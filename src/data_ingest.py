@@ -9,17 +9,36 @@ Responsibilities:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sqlite3
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_DATA_ROOT = PROJECT_ROOT / "nba-dataset"
 
+SQLITE_READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# GAME_ID suffix (last three digits) -> compact GAME_TYPE code stored alongside each game.
+GAME_TYPE_REGULAR_SEASON = 0
+GAME_TYPE_PLAYOFFS = 1
+GAME_TYPE_PRESEASON = 2
+GAME_TYPE_OTHER = 3
+GAME_TYPE_BY_SUFFIX = {1: GAME_TYPE_REGULAR_SEASON, 4: GAME_TYPE_PLAYOFFS, 2: GAME_TYPE_PRESEASON}
+
 
 @dataclass(frozen=True)
 class DataSourceConfig:
@@ -50,12 +69,76 @@ class NBADataIngestor:
         Configuration object containing CSV directory and SQLite database path.
     prefer_sqlite:
         When True, attempts to pull tables from SQLite before falling back to CSV.
+
+    SQLite connections are opened on first use and pooled for reuse: sequential reads share one
+    connection, while concurrent reads (see ``read_tables``) each borrow their own. Call ``close()``
+    (or use the ingestor as a context manager) to release them.
     """
 
     def __init__(self, source_config: Optional[DataSourceConfig] = None, *, prefer_sqlite: bool = True) -> None:
         self.source_config = source_config or DataSourceConfig()
         self.source_config.validate()
         self.prefer_sqlite = prefer_sqlite
+        self._cache_dir = self.source_config.csv_dir.parent / "parquet_cache"
+        self._cache_writer: Optional[ThreadPoolExecutor] = None
+        self._idle_connections: list[sqlite3.Connection] = []
+        self._pool_closed = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "NBADataIngestor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close pooled SQLite connections and wait for pending cache writes.
+
+        Connections still borrowed by an in-flight read are closed when they are returned instead of
+        going back to the pool; reads started after ``close()`` use a connection that is closed on return.
+        """
+        with self._lock:
+            self._pool_closed = True
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
+        if self._cache_writer is not None:
+            self._cache_writer.shutdown(wait=True)
+            self._cache_writer = None
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled SQLite connection, opening and tuning a new one if none is idle."""
+        with self._lock:
+            conn = self._idle_connections.pop() if self._idle_connections else None
+        if conn is None:
+            # Read-only, autocommit connections: no implicit transactions are opened for SELECTs.
+            # Connections may be handed between threads, but only one thread uses a connection at a time.
+            conn = sqlite3.connect(
+                f"{self.source_config.sqlite_path.as_uri()}?mode=ro",
+                uri=True,
+                isolation_level=None,
+                detect_types=0,
+                check_same_thread=False,
+            )
+            for pragma in SQLITE_READ_PRAGMAS:
+                conn.execute(pragma)
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if not self._pool_closed:
+                    self._idle_connections.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def list_sqlite_tables(self) -> list[str]:
+        """Return table names available in the SQLite database."""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name").fetchall()
+        return [name for (name,) in rows]
 
     def list_csv_tables(self) -> Dict[str, Path]:
         """Return available CSV tables keyed by table name (stem)."""
@@ -85,32 +168,83 @@ class NBADataIngestor:
         df.columns = [col.upper() for col in df.columns]
         return df
 
-    def _read_sqlite_table(self, table: str, *, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
-        """Internal helper to read a table from the SQLite database."""
-        with sqlite3.connect(self.source_config.sqlite_path) as conn:
-            conn.row_factory = sqlite3.Row
+    def read_tables(self, tables: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Load several tables concurrently, keyed by table name.
+
+        Each table is read via ``read_table`` on a worker thread; SQLite and the Arrow CSV reader
+        release the GIL while fetching, so cold reads overlap instead of running back to back.
+        """
+        names = list(dict.fromkeys(tables))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            futures = {name: pool.submit(self.read_table, name) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _read_sqlite_table(
+        self,
+        table: str,
+        *,
+        columns: Optional[Iterable[str]] = None,
+        where: Optional[str] = None,
+        params: Sequence[object] = (),
+    ) -> pd.DataFrame:
+        """
+        Internal helper to read a table from the SQLite database.
+
+        An optional WHERE clause (with bound parameters) lets callers filter rows inside SQLite
+        instead of materializing the full table in pandas. Rows land in Arrow-backed columns to
+        avoid object/float64 boxing of large tables; the result is read in one pass so column types
+        are inferred from every row. Reads reuse the ingestor's pooled connections, so SQLite's
+        page cache carries over between tables.
+        """
+        with self._connection() as conn:
             try:
                 if columns:
                     col_clause = ", ".join(columns)
                 else:
                     col_clause = "*"
                 query = f"SELECT {col_clause} FROM {table}"
-                df = pd.read_sql_query(query, conn)
-            except sqlite3.OperationalError as exc:
+                if where:
+                    query = f"{query} WHERE {where}"
+                df = pd.read_sql_query(query, conn, params=tuple(params), dtype_backend="pyarrow")
+            except (sqlite3.OperationalError, pd.errors.DatabaseError) as exc:
                 raise ValueError(f"Table '{table}' not found in SQLite database") from exc
         return df
 
     def _read_csv_table(self, table: str, *, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
-        """Internal helper to read a table from CSV exports."""
+        """
+        Internal helper to read a table from CSV exports.
+
+        Full-table reads are mirrored to a Parquet cache beside the CSV directory in the background;
+        later reads prefer that cache while it is newer than the source CSV. Requested columns are
+        pushed down to the reader so unused columns are never decoded.
+        """
         csv_files = self.list_csv_tables()
         if table not in csv_files:
             raise ValueError(f"Table '{table}' not found in CSV directory {self.source_config.csv_dir}")
-        df = pd.read_csv(csv_files[table])
-        if columns:
-            missing = set(columns) - set(df.columns)
-            if missing:
-                raise ValueError(f"Columns {missing} not found in table '{table}'")
-            df = df.loc[:, list(columns)]
+        csv_path = csv_files[table]
+        column_list = list(columns) if columns else None
+
+        cache_path = self._cache_dir / f"{table}.parquet"
+        if cache_path.exists() and cache_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+            if column_list:
+                _check_columns_exist(table, pq.read_schema(cache_path).names, column_list)
+            return pd.read_parquet(cache_path, columns=column_list, dtype_backend="pyarrow")
+
+        if column_list:
+            _check_columns_exist(table, pd.read_csv(csv_path, nrows=0).columns, column_list)
+            return pd.read_csv(csv_path, engine="pyarrow", usecols=column_list, dtype_backend="pyarrow")
+
+        df = pd.read_csv(csv_path, engine="pyarrow", dtype_backend="pyarrow")
+        # The writer gets an immutable Arrow snapshot (sharing the column buffers), never ``df``
+        # itself: callers rename and add columns on the returned frame while the write is running.
+        snapshot = pa.Table.from_pandas(df, preserve_index=False)
+        with self._lock:
+            if self._cache_writer is None:
+                self._cache_writer = ThreadPoolExecutor(max_workers=1)
+            self._cache_writer.submit(_write_parquet_cache, snapshot, cache_path)
         return df
 
     # -- Domain Specific Accessors -------------------------------------------------
@@ -120,24 +254,51 @@ class NBADataIngestor:
         Retrieve game-level records with season stage flags.
 
         The 'game' table uses a GAME_ID suffix convention (e.g., '001' regular season, '002' preseason,
-        '004' playoffs). This helper filters based on suffixes for reproducibility.
+        '004' playoffs). The suffix is decoded once into an int8 GAME_TYPE column (see GAME_TYPE_*),
+        from which the stage filter and IS_REGULAR_SEASON / IS_PLAYOFFS flags are derived.
         """
-        game_df = self.read_table("game")
         if playoffs_only and regular_season_only:
             raise ValueError("Cannot request both playoffs_only and regular_season_only")
 
-        suffix = game_df["GAME_ID"].astype(str).str[-3:]
-        is_regular = suffix == "001"
-        is_playoffs = suffix == "004"
+        stage = GAME_TYPE_PLAYOFFS if playoffs_only else GAME_TYPE_REGULAR_SEASON if regular_season_only else None
+        if self.prefer_sqlite:
+            try:
+                return self._read_sqlite_games(stage)
+            except (sqlite3.DatabaseError, FileNotFoundError, ValueError):
+                pass
 
-        if playoffs_only:
-            game_df = game_df.loc[is_playoffs].copy()
-        elif regular_season_only:
-            game_df = game_df.loc[is_regular].copy()
+        # Straight to CSV: going through read_table would retry the SQLite read that just failed.
+        game_df = self._read_csv_table("game")
+        game_df.columns = [col.upper() for col in game_df.columns]
+        game_type = _game_type_codes(game_df["GAME_ID"])
+        if stage is not None:
+            stage_mask = game_type == stage
+            game_df = game_df.loc[stage_mask].copy()
+            game_type = game_type[stage_mask]
+        game_df["GAME_TYPE"] = game_type
+        return _finalize_games(game_df)
 
-        game_df["IS_REGULAR_SEASON"] = is_regular
-        game_df["IS_PLAYOFFS"] = is_playoffs
-        return game_df
+    def _read_sqlite_games(self, stage: Optional[int]) -> pd.DataFrame:
+        """
+        Read the 'game' table from SQLite with the GAME_TYPE code computed in SQL.
+
+        When a stage is requested only matching rows cross into pandas and GAME_TYPE is a known
+        constant; otherwise it is decoded per row with a CASE expression.
+        """
+        suffix_expr = "CAST(GAME_ID AS INTEGER) % 1000"
+        if stage is not None:
+            suffixes = [suffix for suffix, game_type in GAME_TYPE_BY_SUFFIX.items() if game_type == stage]
+            game_df = self._read_sqlite_table("game", where=f"{suffix_expr} = ?", params=suffixes)
+            game_df.columns = [col.upper() for col in game_df.columns]
+            game_df["GAME_TYPE"] = np.int8(stage)
+            return _finalize_games(game_df)
+
+        cases = " ".join(f"WHEN {suffix} THEN {game_type}" for suffix, game_type in GAME_TYPE_BY_SUFFIX.items())
+        columns = ["*", f"CASE {suffix_expr} {cases} ELSE {GAME_TYPE_OTHER} END AS GAME_TYPE"]
+        game_df = self._read_sqlite_table("game", columns=columns)
+        game_df.columns = [col.upper() for col in game_df.columns]
+        game_df["GAME_TYPE"] = game_df["GAME_TYPE"].to_numpy(dtype=np.int8)
+        return _finalize_games(game_df)
 
     def line_scores(self) -> pd.DataFrame:
         """Return per-team-per-game line score data."""
@@ -154,3 +315,53 @@ class NBADataIngestor:
     def player_info(self) -> pd.DataFrame:
         """Return player metadata."""
         return self.read_table("common_player_info")
+
+
+def _game_type_codes(game_ids: pd.Series) -> np.ndarray:
+    """Decode GAME_ID suffixes into int8 GAME_TYPE codes; non-numeric IDs map to GAME_TYPE_OTHER."""
+    suffixes = pd.to_numeric(game_ids, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) % 1000
+    conditions = [suffixes == suffix for suffix in GAME_TYPE_BY_SUFFIX]
+    return np.select(conditions, list(GAME_TYPE_BY_SUFFIX.values()), default=GAME_TYPE_OTHER).astype(np.int8)
+
+
+def _finalize_games(game_df: pd.DataFrame) -> pd.DataFrame:
+    """Derive stage flags from GAME_TYPE and categorize team IDs."""
+    game_df["IS_REGULAR_SEASON"] = game_df["GAME_TYPE"] == GAME_TYPE_REGULAR_SEASON
+    game_df["IS_PLAYOFFS"] = game_df["GAME_TYPE"] == GAME_TYPE_PLAYOFFS
+    return _categorize_team_ids(game_df)
+
+
+def _categorize_team_ids(game_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store home/away team IDs as categoricals sharing one sorted category set.
+
+    Downstream groupbys can then reuse the integer category codes instead of re-hashing IDs, and
+    the shared dtype keeps the column categorical when home and away rows are concatenated.
+    """
+    team_cols = [col for col in ("TEAM_ID_HOME", "TEAM_ID_AWAY") if col in game_df.columns]
+    if not team_cols:
+        return game_df
+    team_ids = pd.concat([game_df[col] for col in team_cols], ignore_index=True)
+    team_dtype = pd.CategoricalDtype(team_ids.dropna().drop_duplicates().sort_values())
+    for col in team_cols:
+        game_df[col] = game_df[col].astype(team_dtype)
+    return game_df
+
+
+def _check_columns_exist(table: str, available: Iterable[str], columns: Iterable[str]) -> None:
+    """Raise ValueError when requested columns are absent from a table."""
+    missing = set(columns) - set(available)
+    if missing:
+        raise ValueError(f"Columns {missing} not found in table '{table}'")
+
+
+def _write_parquet_cache(table: pa.Table, cache_path: Path) -> None:
+    """Persist a CSV-backed table as Parquet, replacing any previous cache atomically."""
+    tmp_path = cache_path.with_suffix(".parquet.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, tmp_path, compression="zstd")
+        tmp_path.replace(cache_path)
+    except OSError:
+        # The cache is an optimization only; unwritable data directories fall back to CSV reads.
+        tmp_path.unlink(missing_ok=True)
@@ -10,9 +10,13 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
+from src.aggregation import make_group_codes
+
 DEFAULT_ERA_PATH = Path(__file__).resolve().parent / "config" / "era_segments.json"
+_OPEN_ENDED_YEAR = np.iinfo(np.int64).max
 
 
 @dataclass(frozen=True)
@@ -25,9 +29,19 @@ class EraDefinition:
     end_year: Optional[int]
     description: str | None = None
 
+    def __post_init__(self) -> None:
+        # Resolve the open-ended upper bound once so contains() compares ints only.
+        upper_bound = self.end_year if self.end_year is not None else _OPEN_ENDED_YEAR
+        object.__setattr__(self, "_upper_bound", upper_bound)
+
     def contains(self, season_year: int) -> bool:
-        upper_bound = self.end_year if self.end_year is not None else float("inf")
-        return self.start_year <= season_year <= upper_bound
+        """
+        Check whether a single season year falls inside this era.
+
+        Bulk lookups should go through ``resolve_era_for_year`` / ``annotate_era``, which use a
+        vectorized search over all eras instead of per-era checks.
+        """
+        return self.start_year <= season_year <= self._upper_bound
 
 
 @lru_cache(maxsize=1)
@@ -44,15 +58,59 @@ def load_era_definitions(path: Optional[Path] = None) -> tuple[EraDefinition, ..
     return eras
 
 
+@dataclass(frozen=True)
+class _EraLookup:
+    """Era definitions sorted by start year with parallel NumPy arrays for vectorized lookups."""
+
+    eras: tuple[EraDefinition, ...]
+    starts: np.ndarray
+    ends: np.ndarray
+    keys: np.ndarray
+    labels: np.ndarray
+
+    def locate(self, season_years: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (index, valid) arrays locating each integer season year among the sorted eras.
+
+        Indices are clipped into range so they are always safe to gather with; ``valid`` marks
+        the years that actually fall inside an era.
+        """
+        idx = np.searchsorted(self.starts, season_years, side="right") - 1
+        safe_idx = np.clip(idx, 0, len(self.starts) - 1)
+        valid = (idx >= 0) & (season_years <= self.ends[safe_idx])
+        return safe_idx, valid
+
+
+@lru_cache(maxsize=4)
+def _build_era_lookup(eras: tuple[EraDefinition, ...]) -> _EraLookup:
+    ordered = tuple(sorted(eras, key=lambda era: era.start_year))
+    return _EraLookup(
+        eras=ordered,
+        starts=np.array([era.start_year for era in ordered], dtype=np.int64),
+        # Open-ended eras use the int64 maximum so bounds checks stay integer-only.
+        ends=np.array(
+            [era.end_year if era.end_year is not None else _OPEN_ENDED_YEAR for era in ordered],
+            dtype=np.int64,
+        ),
+        keys=np.array([era.key for era in ordered], dtype=object),
+        labels=np.array([era.label for era in ordered], dtype=object),
+    )
+
+
+def _era_lookup(eras: Optional[Iterable[EraDefinition]]) -> _EraLookup:
+    """Return the memoized lookup for the given eras (defaults to the configured definitions)."""
+    return _build_era_lookup(load_era_definitions() if eras is None else tuple(eras))
+
+
 def resolve_era_for_year(season_year: int, *, eras: Optional[Iterable[EraDefinition]] = None) -> EraDefinition:
     """
     Determine which era a given season year belongs to.
     """
-    era_list = tuple(eras) if eras is not None else load_era_definitions()
-    for era in era_list:
-        if era.contains(season_year):
-            return era
-    raise ValueError(f"No era definition found for season year {season_year}")
+    lookup = _era_lookup(eras)
+    idx, valid = lookup.locate(np.asarray(season_year))
+    if not valid:
+        raise ValueError(f"No era definition found for season year {season_year}")
+    return lookup.eras[int(idx)]
 
 
 def annotate_era(
@@ -69,24 +127,21 @@ def annotate_era(
     if season_col not in df.columns:
         raise ValueError(f"Cannot annotate era without '{season_col}' column.")
 
-    era_list = tuple(eras) if eras is not None else load_era_definitions()
-
-    def _resolve(year: float) -> EraDefinition | None:
-        if pd.isna(year):
-            return None
-        year_int = int(year)
-        for era in era_list:
-            if era.contains(year_int):
-                return era
-        return None
+    lookup = _era_lookup(eras)
+    years = pd.to_numeric(df[season_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    has_year = ~np.isnan(years)
+    idx, valid = lookup.locate(np.where(has_year, years, 0).astype(np.int64))
+    missing = ~(valid & has_year)
+    end_years = lookup.ends[idx]
 
-    result = df.copy()
-    era_series = result[season_col].apply(_resolve)
-    result["ERA_KEY"] = era_series.map(lambda era: era.key if era else pd.NA)
-    result["ERA_LABEL"] = era_series.map(lambda era: era.label if era else pd.NA)
-    result["ERA_START_YEAR"] = era_series.map(lambda era: era.start_year if era else pd.NA)
-    result["ERA_END_YEAR"] = era_series.map(lambda era: era.end_year if (era and era.end_year is not None) else pd.NA)
-    return result
+    # Gather every era field from the lookup arrays with the same index/mask and attach them in a
+    # single assign; each column keeps a typed (string/Int64) array rather than object values.
+    return df.assign(
+        ERA_KEY=pd.array(np.where(missing, None, lookup.keys[idx]), dtype="string"),
+        ERA_LABEL=pd.array(np.where(missing, None, lookup.labels[idx]), dtype="string"),
+        ERA_START_YEAR=pd.arrays.IntegerArray(lookup.starts[idx], missing),
+        ERA_END_YEAR=pd.arrays.IntegerArray(end_years, missing | (end_years == _OPEN_ENDED_YEAR)),
+    )
 
 
 def summarize_by_era(
@@ -109,46 +164,78 @@ def summarize_by_era(
     if missing:
         raise ValueError(f"Cannot summarize by era; missing columns: {missing}")
 
-    grouped = df.groupby(["ERA_KEY", "ERA_LABEL", "IS_PLAYOFFS", "ERA_START_YEAR", "ERA_END_YEAR"], dropna=False)
-    records: list[dict[str, object]] = []
-    for (era_key, era_label, is_playoffs, era_start, era_end), group in grouped:
-        record: dict[str, object] = {
-            "ERA_KEY": era_key,
-            "ERA_LABEL": era_label,
-            "ERA_START_YEAR": era_start,
-            "ERA_END_YEAR": era_end,
-            "IS_PLAYOFFS": is_playoffs,
-            "TOTAL_GAMES": group[weight_col].fillna(0).sum(),
-            "TEAM_SEASONS": len(group),
-        }
-
-        weights = group[weight_col].fillna(0)
-        total_weight = weights.sum()
-
-        for metric in metrics:
-            if metric not in group.columns:
-                continue
-            values = group[metric]
-            valid_mask = values.notna() & weights.gt(0)
-            if valid_mask.any() and total_weight > 0:
-                metric_weight = weights[valid_mask]
-                record[metric] = (values[valid_mask] * metric_weight).sum() / metric_weight.sum()
-            else:
-                record[metric] = pd.NA
-
-        if "TOTAL_EST_POSSESSIONS" in group.columns:
-            record["TOTAL_EST_POSSESSIONS"] = group["TOTAL_EST_POSSESSIONS"].fillna(0).sum()
-        if "WIN_PCT" in group.columns:
-            valid_mask = group["WIN_PCT"].notna() & weights.gt(0)
-            if valid_mask.any() and total_weight > 0:
-                win_weight = weights[valid_mask]
-                record["WEIGHTED_WIN_PCT"] = (group.loc[valid_mask, "WIN_PCT"] * win_weight).sum() / win_weight.sum()
-            else:
-                record["WEIGHTED_WIN_PCT"] = pd.NA
-
-        records.append(record)
-
-    era_df = pd.DataFrame.from_records(records)
+    group_cols = ["ERA_KEY", "ERA_LABEL", "IS_PLAYOFFS", "ERA_START_YEAR", "ERA_END_YEAR"]
+    codes, era_df = make_group_codes(df, group_cols)
+    era_df = era_df[["ERA_KEY", "ERA_LABEL", "ERA_START_YEAR", "ERA_END_YEAR", "IS_PLAYOFFS"]]
+    ngroups = len(era_df)
+
+    weights = df[weight_col].fillna(0).to_numpy(dtype=np.float64)
+    totals = [weights, np.ones_like(weights)]
+    if "TOTAL_EST_POSSESSIONS" in df.columns:
+        totals.append(df["TOTAL_EST_POSSESSIONS"].fillna(0).to_numpy(dtype=np.float64))
+    total_sums = _group_sums(codes, np.column_stack(totals), ngroups)
+    total_games = total_sums[:, 0]
+    if pd.api.types.is_integer_dtype(df[weight_col]):
+        # Float sums of integer weights are exact; restore the integer type for exports.
+        total_games = total_games.astype(np.int64)
+    era_df["TOTAL_GAMES"] = total_games
+    era_df["TEAM_SEASONS"] = total_sums[:, 1].astype(np.int64)
+
+    present_metrics = [metric for metric in metrics if metric in df.columns]
+    if "WIN_PCT" in df.columns:
+        present_metrics.append("WIN_PCT")
+    values = df[present_metrics].to_numpy(dtype=np.float64, na_value=np.nan)
+    sums, weight_sums = _weighted_sums_by_group(codes, values, weights, ngroups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(weight_sums > 0, sums / weight_sums, np.nan)
+
+    for j, metric in enumerate(present_metrics):
+        if metric != "WIN_PCT":
+            era_df[metric] = means[:, j]
+    if "TOTAL_EST_POSSESSIONS" in df.columns:
+        era_df["TOTAL_EST_POSSESSIONS"] = total_sums[:, 2]
+    if "WIN_PCT" in df.columns:
+        era_df["WEIGHTED_WIN_PCT"] = means[:, -1]
+
     if not era_df.empty:
         era_df = era_df.sort_values(["ERA_START_YEAR", "IS_PLAYOFFS"]).reset_index(drop=True)
     return era_df
+
+
+def _weighted_sums_by_group(
+    codes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    ngroups: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a (rows, metrics) value matrix to per-group weighted sums and weight totals.
+
+    Rows with a missing value or a non-positive weight do not contribute to that metric.
+    """
+    valid = ~np.isnan(values) & (weights > 0)[:, None]
+    row_weights = np.where(valid, weights[:, None], 0.0)
+    weighted_values = np.where(valid, values, 0.0) * row_weights
+
+    ncols = values.shape[1]
+    reduced = _group_sums(codes, np.hstack([weighted_values, row_weights]), ngroups)
+    return reduced[:, :ncols], reduced[:, ncols:]
+
+
+def _group_sums(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    """
+    Sum the rows of a 2-D array per group code, returning a (ngroups, columns) array.
+
+    Codes from ``make_group_codes`` are numbered by first appearance, so they are non-decreasing
+    exactly when each group's rows are contiguous (e.g. input sorted by era). That case is reduced
+    with a single ``np.add.reduceat`` over the group boundaries, with no hashing or scatter;
+    otherwise each column is scattered into its group with ``np.bincount``.
+    """
+    if len(codes) and np.all(codes[1:] >= codes[:-1]):
+        boundaries = np.flatnonzero(np.diff(codes, prepend=-1))
+        return np.add.reduceat(values, boundaries, axis=0)
+
+    sums = np.empty((ngroups, values.shape[1]), dtype=np.float64)
+    for j in range(values.shape[1]):
+        sums[:, j] = np.bincount(codes, weights=values[:, j], minlength=ngroups)
+    return sums
@@ -1,9 +1,16 @@
 """
 Feature engineering utilities for deriving pace, efficiency, and shooting metrics.
+
+Each ``compute_*`` helper returns a copy of the input with its derived columns appended. Formulas run
+on plain float64 NumPy arrays rather than pandas Series. Pipelines that derive several feature groups
+at once should prefer ``compute_team_game_features``, which shares the input arrays across formulas
+and copies the input frame a single time, or ``team_game_feature_columns`` when they attach the
+derived arrays themselves without copying the input at all.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -20,12 +27,7 @@ def compute_pace(df: pd.DataFrame, possessions_col: str, minutes_col: str = "MIN
     minutes_col:
         Column representing total minutes played for the team in the game.
     """
-    result = df.copy()
-    if possessions_col not in result.columns or minutes_col not in result.columns:
-        raise ValueError(f"Columns {possessions_col!r} and {minutes_col!r} must exist to calculate pace.")
-
-    result["PACE"] = (result[possessions_col] * 48) / result[minutes_col]
-    return result
+    return df.assign(**_pace_columns(_ColumnArrays(df), possessions_col, minutes_col))
 
 
 def compute_efficiency(df: pd.DataFrame, points_col: str, possessions_col: str, prefix: str = "OFF") -> pd.DataFrame:
@@ -41,12 +43,7 @@ def compute_efficiency(df: pd.DataFrame, points_col: str, possessions_col: str,
     prefix:
         Prefix for naming the derived efficiency column, defaults to 'OFF'.
     """
-    result = df.copy()
-    if points_col not in result.columns or possessions_col not in result.columns:
-        raise ValueError(f"Columns {points_col!r} and {possessions_col!r} must exist to calculate efficiency.")
-
-    result[f"{prefix}_EFF_PER_100"] = (result[points_col] * 100) / result[possessions_col]
-    return result
+    return df.assign(**_efficiency_columns(_ColumnArrays(df), points_col, possessions_col, prefix))
 
 
 def compute_shot_profile(df: pd.DataFrame, *, fgm_col: str, fga_col: str, fg3m_col: str, fg3a_col: str) -> pd.DataFrame:
@@ -58,27 +55,181 @@ def compute_shot_profile(df: pd.DataFrame, *, fgm_col: str, fga_col: str, fg3m_c
         * THREE_POINT_SHARE_OF_PTS: fraction of points coming from threes.
         * EFFECTIVE_FG_PCT: efficiency adjusted for three-point value.
     """
-    result = df.copy()
-    missing = [col for col in (fgm_col, fga_col, fg3m_col, fg3a_col) if col not in result.columns]
-    if missing:
-        raise ValueError(f"Missing required columns for shot profile: {missing}")
-
-    result["THREE_POINT_RATE"] = result[fg3a_col] / result[fga_col].replace(0, pd.NA)
-    result["THREE_POINT_SHARE_OF_PTS"] = (3 * result[fg3m_col]) / (2 * result[fgm_col] + result[fg3m_col]).replace(0, pd.NA)
-    result["EFFECTIVE_FG_PCT"] = (result[fgm_col] + 0.5 * result[fg3m_col]) / result[fga_col].replace(0, pd.NA)
-    return result
+    arrays = _ColumnArrays(df)
+    return df.assign(**_shot_profile_columns(arrays, fgm_col=fgm_col, fga_col=fga_col, fg3m_col=fg3m_col, fg3a_col=fg3a_col))
 
 
 def compute_ball_security(df: pd.DataFrame, *, assists_col: str, turnovers_col: str) -> pd.DataFrame:
     """
     Calculate assist-to-turnover ratio and turnover percentage.
     """
-    result = df.copy()
-    missing = [col for col in (assists_col, turnovers_col) if col not in result.columns]
+    return df.assign(**_ball_security_columns(_ColumnArrays(df), assists_col=assists_col, turnovers_col=turnovers_col))
+
+
+def compute_team_game_features(
+    df: pd.DataFrame,
+    *,
+    possessions_col: str = "EST_POSSESSIONS",
+    minutes_col: str = "MINUTES_PLAYED",
+    points_col: str = "PTS",
+    opp_points_col: str = "OPP_PTS",
+    fgm_col: str = "FGM",
+    fga_col: str = "FGA",
+    fg3m_col: str = "FG3M",
+    fg3a_col: str = "FG3A",
+    assists_col: str = "AST",
+    turnovers_col: str = "TOV",
+) -> pd.DataFrame:
+    """
+    Derive pace, offensive/defensive efficiency, shot profile, and ball security in one step.
+
+    Equivalent to chaining the individual ``compute_*`` helpers, but every input column is pulled
+    into a contiguous float64 array once and shared by all formulas, and the derived columns are
+    attached with a single ``assign`` so the input is copied only once.
+    """
+    return df.assign(
+        **team_game_feature_columns(
+            df,
+            possessions_col=possessions_col,
+            minutes_col=minutes_col,
+            points_col=points_col,
+            opp_points_col=opp_points_col,
+            fgm_col=fgm_col,
+            fga_col=fga_col,
+            fg3m_col=fg3m_col,
+            fg3a_col=fg3a_col,
+            assists_col=assists_col,
+            turnovers_col=turnovers_col,
+        )
+    )
+
+
+def team_game_feature_columns(
+    df: pd.DataFrame,
+    *,
+    possessions_col: str = "EST_POSSESSIONS",
+    minutes_col: str = "MINUTES_PLAYED",
+    points_col: str = "PTS",
+    opp_points_col: str = "OPP_PTS",
+    fgm_col: str = "FGM",
+    fga_col: str = "FGA",
+    fg3m_col: str = "FG3M",
+    fg3a_col: str = "FG3A",
+    assists_col: str = "AST",
+    turnovers_col: str = "TOV",
+) -> dict[str, np.ndarray]:
+    """
+    Return the columns ``compute_team_game_features`` would add, as ``name -> float64 array``.
+
+    The input frame is read but not copied, so callers assembling a larger frame can attach the
+    arrays in the same step as their own derived columns.
+    """
+    arrays = _ColumnArrays(df)
+    columns: dict[str, np.ndarray] = {}
+    columns.update(_pace_columns(arrays, possessions_col, minutes_col))
+    columns.update(_efficiency_columns(arrays, points_col, possessions_col, "OFF"))
+    columns.update(_efficiency_columns(arrays, opp_points_col, possessions_col, "DEF"))
+    columns.update(_shot_profile_columns(arrays, fgm_col=fgm_col, fga_col=fga_col, fg3m_col=fg3m_col, fg3a_col=fg3a_col))
+    columns.update(_ball_security_columns(arrays, assists_col=assists_col, turnovers_col=turnovers_col))
+    return columns
+
+
+# --------------------------------------------------------------------------- #
+# Internal helpers
+
+
+class _ColumnArrays:
+    """
+    Struct-of-arrays view over a dataframe's numeric columns.
+
+    Each column is converted to a contiguous float64 array on first access (missing values become
+    NaN) and cached, so formulas sharing an input reuse the same buffer.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._df.columns
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column not in self._arrays:
+            self._arrays[column] = self._df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._arrays[column]
+
+
+def _pace_columns(arrays: _ColumnArrays, possessions_col: str, minutes_col: str) -> dict[str, np.ndarray]:
+    if possessions_col not in arrays or minutes_col not in arrays:
+        raise ValueError(f"Columns {possessions_col!r} and {minutes_col!r} must exist to calculate pace.")
+
+    pace = np.multiply(arrays[possessions_col], 48.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(pace, arrays[minutes_col], out=pace)
+    return {"PACE": pace}
+
+
+def _efficiency_columns(arrays: _ColumnArrays, points_col: str, possessions_col: str, prefix: str) -> dict[str, np.ndarray]:
+    if points_col not in arrays or possessions_col not in arrays:
+        raise ValueError(f"Columns {points_col!r} and {possessions_col!r} must exist to calculate efficiency.")
+
+    efficiency = np.multiply(arrays[points_col], 100.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(efficiency, arrays[possessions_col], out=efficiency)
+    return {f"{prefix}_EFF_PER_100": efficiency}
+
+
+def _shot_profile_columns(
+    arrays: _ColumnArrays, *, fgm_col: str, fga_col: str, fg3m_col: str, fg3a_col: str
+) -> dict[str, np.ndarray]:
+    missing = [col for col in (fgm_col, fga_col, fg3m_col, fg3a_col) if col not in arrays]
+    if missing:
+        raise ValueError(f"Missing required columns for shot profile: {missing}")
+
+    fgm = arrays[fgm_col]
+    fga = arrays[fga_col]
+    fg3m = arrays[fg3m_col]
+    fg3a = arrays[fg3a_col]
+
+    # Both FGA-based ratios share one zero-FGA mask but each still divides directly, so results match
+    # plain ``numerator / fga`` bit for bit; numerators are fresh scratch buffers finished in place.
+    fga_present = fga != 0
+    three_rate = np.divide(fg3a, fga, out=np.full_like(fg3a, np.nan), where=fga_present)
+    effective_fg = np.multiply(fg3m, 0.5)
+    effective_fg += fgm
+    np.divide(effective_fg, fga, out=effective_fg, where=fga_present)
+    effective_fg[~fga_present] = np.nan
+    three_share = np.multiply(fg3m, 3.0)
+    points_from_fg = np.multiply(fgm, 2.0)
+    points_from_fg += fg3m
+    return {
+        "THREE_POINT_RATE": three_rate,
+        "THREE_POINT_SHARE_OF_PTS": _divide_in_place(three_share, points_from_fg),
+        "EFFECTIVE_FG_PCT": effective_fg,
+    }
+
+
+def _ball_security_columns(arrays: _ColumnArrays, *, assists_col: str, turnovers_col: str) -> dict[str, np.ndarray]:
+    missing = [col for col in (assists_col, turnovers_col) if col not in arrays]
     if missing:
         raise ValueError(f"Missing required columns for ball security: {missing}")
 
-    result["AST_TOV_RATIO"] = result[assists_col] / result[turnovers_col].replace(0, pd.NA)
-    result["TURNOVER_PCT"] = result[turnovers_col] / (result[assists_col] + result[turnovers_col]).replace(0, pd.NA)
-    return result
+    assists = arrays[assists_col]
+    turnovers = arrays[turnovers_col]
+    return {
+        "AST_TOV_RATIO": _safe_divide(assists, turnovers),
+        "TURNOVER_PCT": _safe_divide(turnovers, assists + turnovers),
+    }
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division that yields NaN wherever the denominator is zero."""
+    return np.divide(numerator, denominator, out=np.full_like(numerator, np.nan), where=denominator != 0)
+
 
+def _divide_in_place(buffer: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Like ``_safe_divide`` but overwrites a scratch numerator buffer instead of allocating."""
+    zero_denominator = denominator == 0
+    np.divide(buffer, denominator, out=buffer, where=~zero_denominator)
+    buffer[zero_denominator] = np.nan
+    return buffer
@@ -5,12 +5,18 @@ Currently focuses on generating team game-level features and season summaries.
 """
 
 from .season_summary import (
+    SUMMARY_FORMATS,
     build_team_game_features,
     generate_team_season_summary,
+    scope_tag,
+    write_summary_outputs,
 )
 
 __all__ = [
+    "SUMMARY_FORMATS",
     "build_team_game_features",
     "generate_team_season_summary",
+    "scope_tag",
+    "write_summary_outputs",
 ]
 
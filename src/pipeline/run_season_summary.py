@@ -5,15 +5,24 @@ Command-line utility to generate team-season summaries.
 from __future__ import annotations
 
 import argparse
+import hashlib
 from pathlib import Path
 import sys
+from typing import Iterable, Optional
+
+import pandas as pd
 
 from src.data_ingest import NBADataIngestor
-from src.pipeline.season_summary import generate_team_season_summary
-from src.preprocess import Preprocessor
+from src.era import DEFAULT_ERA_PATH
+from src.pipeline.season_summary import SUMMARY_FORMATS, generate_team_season_summary, scope_tag, write_summary_outputs
+from src.preprocess import DEFAULT_ALIAS_PATH, Preprocessor
 from src.validation import validate_team_summary
 
 
+# Bump whenever the pipeline's output schema or semantics change so stale cached summaries are ignored.
+SUMMARY_CACHE_VERSION = 2
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate team-season aggregates with optional playoffs/regular-season filters.",
@@ -35,12 +44,18 @@ def parse_args() -> argparse.Namespace:
         "--output-dir",
         type=Path,
         default=Path("data/processed"),
-        help="Directory to store the generated CSV (default: data/processed).",
+        help="Directory to store the generated summaries (default: data/processed).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=SUMMARY_FORMATS,
+        default="parquet",
+        help="File format for the saved summaries (default: parquet).",
     )
     parser.add_argument(
         "--no-save",
         action="store_true",
-        help="Do not write the output CSV; still prints a preview.",
+        help="Do not write the output files; still prints a preview.",
     )
     parser.add_argument(
         "--preview-rows",
@@ -64,9 +79,61 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Force reading from CSV exports instead of SQLite.",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached summaries under <output-dir>/cache and recompute from the raw data.",
+    )
     return parser.parse_args()
 
 
+def summary_cache_key(
+    ingestor: NBADataIngestor,
+    *,
+    playoffs_only: bool,
+    regular_season_only: bool,
+    config_paths: Iterable[Path] = (DEFAULT_ERA_PATH, DEFAULT_ALIAS_PATH),
+) -> str:
+    """
+    Fingerprint the raw inputs, configuration, and scope flags that determine a team-season summary.
+
+    The key changes whenever the SQLite database or game CSV is replaced (mtime/size), the era or
+    team-alias configuration is edited (content hash), ``SUMMARY_CACHE_VERSION`` is bumped, or a
+    different source or scope is requested.
+    """
+    config = ingestor.source_config
+    parts = [
+        f"version={SUMMARY_CACHE_VERSION}",
+        f"prefer_sqlite={ingestor.prefer_sqlite}",
+        f"playoffs={playoffs_only}",
+        f"regular={regular_season_only}",
+    ]
+    for source in (config.sqlite_path, config.csv_dir / "game.csv"):
+        if source.exists():
+            stat = source.stat()
+            parts.append(f"{source}:{stat.st_mtime_ns}:{stat.st_size}")
+    digest = hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8)
+    for path in config_paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cached_summary(cache_dir: Path, key: str) -> Optional[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Return cached (team_summary, era_summary) frames for a key, or None when not cached."""
+    team_path = cache_dir / f"{key}_team.parquet"
+    era_path = cache_dir / f"{key}_era.parquet"
+    if not (team_path.exists() and era_path.exists()):
+        return None
+    return pd.read_parquet(team_path), pd.read_parquet(era_path)
+
+
+def store_cached_summary(cache_dir: Path, key: str, summary: pd.DataFrame, era_summary: pd.DataFrame) -> None:
+    """Write team and era summaries to the cache directory under the given key."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    summary.to_parquet(cache_dir / f"{key}_team.parquet", index=False)
+    era_summary.to_parquet(cache_dir / f"{key}_era.parquet", index=False)
+
+
 def main() -> None:
     args = parse_args()
     prefer_sqlite = True
@@ -75,19 +142,32 @@ def main() -> None:
     if args.prefer_csv:
         prefer_sqlite = False
 
-    ingestor = NBADataIngestor(prefer_sqlite=prefer_sqlite)
-    preprocessor = Preprocessor()
-
-    team_result = generate_team_season_summary(
-        ingestor,
-        preprocessor=preprocessor,
-        playoffs_only=args.playoffs,
-        regular_season_only=args.regular_season,
-        output_dir=args.output_dir,
-        save=not args.no_save,
-        return_era_summary=True,
-    )
-    summary, era_summary = team_result
+    save = not args.no_save
+    tag = scope_tag(args.playoffs, args.regular_season)
+    cache_dir = args.output_dir / "cache"
+    saved_paths: Optional[tuple[Path, Path]] = None
+
+    with NBADataIngestor(prefer_sqlite=prefer_sqlite) as ingestor:
+        cache_key = summary_cache_key(ingestor, playoffs_only=args.playoffs, regular_season_only=args.regular_season)
+        cached = None if args.refresh else load_cached_summary(cache_dir, cache_key)
+        if cached is not None:
+            summary, era_summary = cached
+            print(f"Loaded cached summaries ({cache_key}) from {cache_dir}", file=sys.stderr)
+        else:
+            summary, era_summary = generate_team_season_summary(
+                ingestor,
+                preprocessor=Preprocessor.default(),
+                playoffs_only=args.playoffs,
+                regular_season_only=args.regular_season,
+                save=False,
+                return_era_summary=True,
+            )
+            if save:
+                store_cached_summary(cache_dir, cache_key, summary, era_summary)
+        if save:
+            saved_paths = write_summary_outputs(
+                summary, era_summary, output_dir=args.output_dir, tag=tag, output_format=args.format
+            )
 
     preview = summary.head(args.preview_rows)
     print(preview.to_string(index=False))
@@ -104,10 +184,8 @@ def main() -> None:
     else:
         print("Validation checks passed.", file=sys.stderr)
 
-    if not args.no_save:
-        tag = "playoffs" if args.playoffs else "regular" if args.regular_season else "all"
-        team_path = args.output_dir / f"team_season_{tag}.csv"
-        era_path = args.output_dir / f"team_era_{tag}.csv"
+    if saved_paths is not None:
+        team_path, era_path = saved_paths
         print(f"Saved team summary to {team_path}")
         print(f"Saved era summary to {era_path}")
 
@@ -4,18 +4,77 @@ Utilities for assembling game-level feature sets and aggregating to team-season
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+import weakref
+from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from src.aggregation import aggregate_team_season
 from src.data_ingest import NBADataIngestor
-from src.features import compute_ball_security, compute_efficiency, compute_pace, compute_shot_profile
+from src.features import team_game_feature_columns
 from src.preprocess import Preprocessor
 from src.era import annotate_era, summarize_by_era
 
 DEFAULT_OUTPUT_DIR = Path("data/processed")
+SummaryFormat = Literal["parquet", "csv"]
+SUMMARY_FORMATS: tuple[SummaryFormat, ...] = ("parquet", "csv")
+
+# Per-ingestor LRU memo of build_team_game_features results keyed by (preprocessor, playoffs_only,
+# regular_season_only); each ingestor keeps at most _FEATURE_CACHE_SIZE frames, and entries disappear
+# together with their ingestor.
+_FEATURE_CACHE_SIZE = 4
+_FEATURE_CACHE: weakref.WeakKeyDictionary[NBADataIngestor, OrderedDict[tuple, pd.DataFrame]] = (
+    weakref.WeakKeyDictionary()
+)
+
+_BASE_COLUMNS = ("GAME_ID", "SEASON_ID", "SEASON_TYPE", "IS_REGULAR_SEASON", "IS_PLAYOFFS", "GAME_DATE")
+# Per-side wide columns carried into the long table: ``<COL>_<SIDE>`` becomes ``<COL>`` for the team
+# and ``OPP_<COL>`` for its opponent.
+_TEAM_SIDE_COLUMNS = (
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "TEAM_NAME",
+    "MATCHUP",
+    "WL",
+    "FGM",
+    "FGA",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+)
+# Text columns of the long table, kept Arrow-backed rather than as Python-object columns.
+_STRING_COLUMNS = ("SEASON_TYPE", "TEAM_ABBREVIATION", "TEAM_NAME", "MATCHUP", "WL", "OPP_TEAM_ABBREVIATION")
+_ARROW_STRING = pd.ArrowDtype(pa.string())
+_OPPONENT_SIDE_COLUMNS = (
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "PTS",
+    "FGM",
+    "FGA",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "TOV",
+)
 
 
 def build_team_game_features(
@@ -33,36 +92,29 @@ def build_team_game_features(
     ingestor:
         Data ingestor instance for accessing raw tables.
     preprocessor:
-        Optional preprocessor; defaults to base configuration when omitted.
+        Optional preprocessor; defaults to the shared ``Preprocessor.default()`` instance when omitted.
     playoffs_only / regular_season_only:
         Filter game scope. Only one of these may be True at a time.
+
+    Results are memoized per ingestor, preprocessor, and scope (keeping the most recently used
+    few per ingestor), so repeated calls reuse the first build. Each call returns a shallow copy:
+    adding or replacing columns is safe, but values must not be modified in place.
     """
     if playoffs_only and regular_season_only:
         raise ValueError("Only one of playoffs_only or regular_season_only can be True.")
 
-    preprocessor = preprocessor or Preprocessor()
-    games_raw = ingestor.games(playoffs_only=playoffs_only, regular_season_only=regular_season_only)
-    games_long = _reshape_games_to_long(games_raw)
-    games_long = preprocessor.normalize_team_ids(games_long, ["TEAM_ABBREVIATION", "OPP_TEAM_ABBREVIATION"])
-    games_long = preprocessor.attach_season(games_long, "GAME_DATE")
-    games_long["GAME_DATE"] = pd.to_datetime(games_long["GAME_DATE"])
-
-    # Estimate possessions and derive pace/efficiency metrics.
-    enriched = preprocessor.estimate_possessions(games_long)
-    enriched["MINUTES_PLAYED"] = 48 + 5 * enriched["OVERTIME_PERIODS"]
-
-    enriched = compute_pace(enriched, possessions_col="EST_POSSESSIONS", minutes_col="MINUTES_PLAYED")
-    enriched = compute_efficiency(enriched, points_col="PTS", possessions_col="EST_POSSESSIONS", prefix="OFF")
-    enriched = compute_efficiency(enriched, points_col="OPP_PTS", possessions_col="EST_POSSESSIONS", prefix="DEF")
-    enriched = compute_shot_profile(
-        enriched,
-        fgm_col="FGM",
-        fga_col="FGA",
-        fg3m_col="FG3M",
-        fg3a_col="FG3A",
-    )
-    enriched = compute_ball_security(enriched, assists_col="AST", turnovers_col="TOV")
-    return enriched
+    preprocessor = preprocessor or Preprocessor.default()
+    cached = _FEATURE_CACHE.setdefault(ingestor, OrderedDict())
+    key = (preprocessor, playoffs_only, regular_season_only)
+    if key in cached:
+        cached.move_to_end(key)
+    else:
+        cached[key] = _build_team_game_features(
+            ingestor, preprocessor, playoffs_only=playoffs_only, regular_season_only=regular_season_only
+        )
+        if len(cached) > _FEATURE_CACHE_SIZE:
+            cached.popitem(last=False)
+    return cached[key].copy(deep=False)
 
 
 def generate_team_season_summary(
@@ -74,11 +126,13 @@ def generate_team_season_summary(
     output_dir: Path = DEFAULT_OUTPUT_DIR,
     save: bool = True,
     return_era_summary: bool = False,
+    output_format: SummaryFormat = "parquet",
 ) -> pd.DataFrame | tuple[pd.DataFrame, pd.DataFrame]:
     """
     Build team-season aggregates and optionally persist to disk.
 
     When return_era_summary is True, a tuple of (team_summary, era_summary) is returned.
+    Saved files use ``output_format`` ('parquet' by default, or 'csv'); see ``write_summary_outputs``.
     """
     features = build_team_game_features(
         ingestor,
@@ -91,77 +145,115 @@ def generate_team_season_summary(
     era_summary = summarize_by_era(summary)
 
     if save:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        tag = "playoffs" if playoffs_only else "regular" if regular_season_only else "all"
-        summary.to_csv(output_dir / f"team_season_{tag}.csv", index=False)
-        era_summary.to_csv(output_dir / f"team_era_{tag}.csv", index=False)
+        write_summary_outputs(
+            summary,
+            era_summary,
+            output_dir=output_dir,
+            tag=scope_tag(playoffs_only, regular_season_only),
+            output_format=output_format,
+        )
 
     if return_era_summary:
         return summary, era_summary
     return summary
 
 
+def scope_tag(playoffs_only: bool, regular_season_only: bool) -> str:
+    """Return the filename tag used for a game scope ('playoffs', 'regular', or 'all')."""
+    return "playoffs" if playoffs_only else "regular" if regular_season_only else "all"
+
+
+def write_summary_outputs(
+    summary: pd.DataFrame,
+    era_summary: pd.DataFrame,
+    *,
+    output_dir: Path,
+    tag: str,
+    output_format: SummaryFormat = "parquet",
+) -> tuple[Path, Path]:
+    """
+    Persist team-season and era summaries as team_season_{tag}.<ext> / team_era_{tag}.<ext>.
+
+    ``output_format`` selects zstd-compressed Parquet (default) or CSV, which is also the file
+    extension. Returns the (team_path, era_path) written.
+    """
+    if output_format not in SUMMARY_FORMATS:
+        raise ValueError(f"Unsupported output format {output_format!r}; expected one of {SUMMARY_FORMATS}.")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    team_path = output_dir / f"team_season_{tag}.{output_format}"
+    era_path = output_dir / f"team_era_{tag}.{output_format}"
+    for frame, path in ((summary, team_path), (era_summary, era_path)):
+        if output_format == "parquet":
+            frame.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        else:
+            frame.to_csv(path, index=False)
+    return team_path, era_path
+
+
 # --------------------------------------------------------------------------- #
 # Internal helpers
 
 
+def _build_team_game_features(
+    ingestor: NBADataIngestor, preprocessor: Preprocessor, *, playoffs_only: bool, regular_season_only: bool
+) -> pd.DataFrame:
+    games_raw = ingestor.games(playoffs_only=playoffs_only, regular_season_only=regular_season_only)
+    games_long = _reshape_games_to_long(games_raw)
+    games_long = preprocessor.normalize_team_ids(games_long, ["TEAM_ABBREVIATION", "OPP_TEAM_ABBREVIATION"])
+    games_long = preprocessor.attach_season(games_long, "GAME_DATE")  # also parses GAME_DATE to datetime
+
+    # Estimate possessions and derive pace/efficiency metrics.
+    enriched = preprocessor.estimate_possessions(games_long)
+    enriched["MINUTES_PLAYED"] = 48 + 5 * enriched["OVERTIME_PERIODS"].astype(np.int16)
+
+    # The derived features are computed as bare arrays and joined without copying, so the wide
+    # long-format table is never duplicated on its way out.
+    features = team_game_feature_columns(
+        enriched,
+        possessions_col="EST_POSSESSIONS",
+        minutes_col="MINUTES_PLAYED",
+        points_col="PTS",
+        opp_points_col="OPP_PTS",
+    )
+    return pd.concat([enriched, pd.DataFrame(features, index=enriched.index)], axis=1, copy=False)
+
+
 def _reshape_games_to_long(games: pd.DataFrame) -> pd.DataFrame:
     """
     Convert wide game table (home/away columns) into a team-level long format.
+
+    Each side is assembled in a single ``pd.DataFrame`` call from references to the wide columns
+    (listed in ``_TEAM_SIDE_COLUMNS`` / ``_OPPONENT_SIDE_COLUMNS``) rather than by inserting them
+    one at a time into a copied frame.
     """
-    base_cols = ["GAME_ID", "SEASON_ID", "SEASON_TYPE", "IS_REGULAR_SEASON", "IS_PLAYOFFS", "GAME_DATE"]
+    # Both sides share the same base column references; nothing mutates them before the concat.
+    base_columns = {col: games[col] for col in _BASE_COLUMNS}
 
     def _select_side(side: str) -> pd.DataFrame:
         suffix = f"_{side}"
         opp_suffix = "_AWAY" if side == "HOME" else "_HOME"
 
-        data = games[base_cols].copy()
-        data["TEAM_ID"] = games[f"TEAM_ID{suffix}"]
-        data["TEAM_ABBREVIATION"] = games[f"TEAM_ABBREVIATION{suffix}"]
-        data["TEAM_NAME"] = games[f"TEAM_NAME{suffix}"]
-        matchup_series = games[f"MATCHUP{suffix}"].astype(str)
-        data["MATCHUP"] = matchup_series
-        data["WL"] = games[f"WL{suffix}"]
-        data["FGM"] = games[f"FGM{suffix}"]
-        data["FGA"] = games[f"FGA{suffix}"]
-        data["FG3M"] = games[f"FG3M{suffix}"]
-        data["FG3A"] = games[f"FG3A{suffix}"]
-        data["FTM"] = games[f"FTM{suffix}"]
-        data["FTA"] = games[f"FTA{suffix}"]
-        data["OREB"] = games[f"OREB{suffix}"]
-        data["DREB"] = games[f"DREB{suffix}"]
-        data["REB"] = games[f"REB{suffix}"]
-        data["AST"] = games[f"AST{suffix}"]
-        data["STL"] = games[f"STL{suffix}"]
-        data["BLK"] = games[f"BLK{suffix}"]
-        data["TOV"] = games[f"TOV{suffix}"]
-        data["PF"] = games[f"PF{suffix}"]
-        data["PTS"] = games[f"PTS{suffix}"]
-
-        data["OPP_TEAM_ID"] = games[f"TEAM_ID{opp_suffix}"]
-        data["OPP_TEAM_ABBREVIATION"] = games[f"TEAM_ABBREVIATION{opp_suffix}"]
-        data["OPP_PTS"] = games[f"PTS{opp_suffix}"]
-        data["OPP_FGM"] = games[f"FGM{opp_suffix}"]
-        data["OPP_FGA"] = games[f"FGA{opp_suffix}"]
-        data["OPP_FG3M"] = games[f"FG3M{opp_suffix}"]
-        data["OPP_FG3A"] = games[f"FG3A{opp_suffix}"]
-        data["OPP_FTM"] = games[f"FTM{opp_suffix}"]
-        data["OPP_FTA"] = games[f"FTA{opp_suffix}"]
-        data["OPP_OREB"] = games[f"OREB{opp_suffix}"]
-        data["OPP_DREB"] = games[f"DREB{opp_suffix}"]
-        data["OPP_REB"] = games[f"REB{opp_suffix}"]
-        data["OPP_AST"] = games[f"AST{opp_suffix}"]
-        data["OPP_TOV"] = games[f"TOV{opp_suffix}"]
-
-        data["IS_HOME"] = side == "HOME"
-        data["WIN"] = (data["WL"].str.upper() == "W").astype(int)
-        data["OVERTIME_PERIODS"] = matchup_series.map(_parse_overtime_from_matchup)
-        return data
+        matchup_series = games[f"MATCHUP{suffix}"].astype(_ARROW_STRING)
+        # The trailing "OT<n>" tag gives the overtime count; a bare or malformed trailing tag counts as one.
+        overtime = pd.to_numeric(matchup_series.str.extract(r"OT\s*(?P<periods>[+-]?\d+)\s*$", expand=False), errors="coerce")
+        has_overtime = matchup_series.str.contains("OT", regex=False).fillna(False).astype(np.int8)
+        wins = (games[f"WL{suffix}"].str.upper() == "W").to_numpy(dtype=bool, na_value=False).astype(np.int8)
+
+        columns = dict(base_columns)
+        columns.update({col: games[f"{col}{suffix}"] for col in _TEAM_SIDE_COLUMNS})
+        columns["MATCHUP"] = matchup_series
+        columns.update({f"OPP_{col}": games[f"{col}{opp_suffix}"] for col in _OPPONENT_SIDE_COLUMNS})
+        columns["IS_HOME"] = np.full(len(games), side == "HOME")
+        columns["WIN"] = wins
+        columns["OVERTIME_PERIODS"] = overtime.fillna(has_overtime).astype(np.int8)
+        return pd.DataFrame(columns, copy=False)
 
     home_df = _select_side("HOME")
     away_df = _select_side("AWAY")
 
-    combined = pd.concat([home_df, away_df], ignore_index=True)
+    combined = pd.concat([home_df, away_df], ignore_index=True, copy=False)
+    combined = combined.astype({col: _ARROW_STRING for col in _STRING_COLUMNS})
     numeric_cols = [
         "FGM",
         "FGA",
@@ -192,21 +284,29 @@ def _reshape_games_to_long(games: pd.DataFrame) -> pd.DataFrame:
         "OPP_TOV",
         "OVERTIME_PERIODS",
     ]
-    for col in numeric_cols:
-        combined[col] = pd.to_numeric(combined[col], errors="coerce")
+    # Ingested stats normally arrive typed already; only coerce the columns that did not.
+    to_convert = [col for col in numeric_cols if not pd.api.types.is_numeric_dtype(combined[col])]
+    if to_convert:
+        combined[to_convert] = combined[to_convert].apply(pd.to_numeric, errors="coerce")
 
+    # Box-score counts fit comfortably in int16; narrowing them quarters the table's numeric footprint.
+    combined = combined.astype({col: _count_dtype(combined[col]) for col in numeric_cols if col != "OVERTIME_PERIODS"})
     return combined
 
 
-def _parse_overtime_from_matchup(matchup: str) -> int:
+def _count_dtype(values: pd.Series) -> pd.ArrowDtype:
     """
-    Rough overtime estimate based on matchup string suffix.
+    Return the compact dtype for a box-score count column.
+
+    Whole-number columns within the int16 range become nullable Arrow int16; anything else (fractional
+    or out-of-range values) falls back to Arrow float32. Missing values stay missing either way.
     """
-    matchup = str(matchup)
-    if "OT" not in matchup:
-        return 0
-    try:
-        suffix = matchup.split("OT")[-1].strip()
-        return int(suffix) if suffix else 1
-    except ValueError:
-        return 1
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = array[~np.isnan(array)]
+    int16 = np.iinfo(np.int16)
+    if present.size == 0 or (
+        np.array_equal(present, np.trunc(present)) and present.min() >= int16.min and present.max() <= int16.max
+    ):
+        return pd.ArrowDtype(pa.int16())
+    return pd.ArrowDtype(pa.float32())
+
@@ -11,37 +11,76 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 DEFAULT_ALIAS_PATH = Path(__file__).resolve().parent / "config" / "team_aliases.json"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TeamAlias:
-    """Mapping record for team alias harmonization."""
+    """Mapping record for team alias harmonization; immutable so loaded records can be shared."""
 
     canonical_id: str
-    aliases: Iterable[str]
+    aliases: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "aliases", tuple(self.aliases))
 
 
 class Preprocessor:
-    """Bundle of preprocessing routines applied to raw ingested data."""
+    """
+    Bundle of preprocessing routines applied to raw ingested data.
 
-    def __init__(self, *, team_aliases: Optional[Iterable[TeamAlias]] = None) -> None:
-        if team_aliases is None:
-            team_aliases = load_team_aliases()
-        self.team_aliases = list(team_aliases)
-        self._alias_map = self._build_alias_map()
+    Transform methods return a shallow copy of their input: derived columns are added and
+    normalized columns are replaced wholesale, but no existing column buffer is written in place,
+    so the caller's frame is left untouched without copying every column. The returned frame
+    shares those buffers with the input, so mutate it in place only after an explicit ``copy()``.
+    """
 
-    def _build_alias_map(self) -> dict[str, str]:
-        mapping = {}
-        for alias in self.team_aliases:
-            for name in alias.aliases:
-                mapping[name.upper()] = alias.canonical_id.upper()
-        return mapping
+    def __init__(
+        self,
+        *,
+        team_aliases: Optional[Iterable[TeamAlias]] = None,
+        alias_map: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        team_aliases:
+            Alias records to harmonize against; kept as given on ``self.team_aliases``.
+        alias_map:
+            Ready-made upper-case ``alias -> canonical id`` lookup, as returned by ``load_alias_map``;
+            used as-is without rebuilding, with ``self.team_aliases`` grouped from it. Mutually
+            exclusive with ``team_aliases``. When neither is given, the bundled alias file is used.
+        """
+        if team_aliases is not None and alias_map is not None:
+            raise ValueError("Pass either team_aliases or alias_map, not both.")
+        if team_aliases is not None:
+            self.team_aliases = list(team_aliases)
+            alias_map = _alias_map_from_records(self.team_aliases)
+        elif alias_map is None:
+            self.team_aliases = list(load_team_aliases())
+            alias_map = load_alias_map()
+        else:
+            self.team_aliases = _records_from_alias_map(alias_map)
+        self._alias_map = alias_map
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def default(cls) -> Preprocessor:
+        """
+        Return a shared instance configured from the bundled alias file.
+
+        The alias file is parsed and the lookup table built once per process, so pipelines that run
+        repeatedly can reuse this rather than constructing a fresh ``Preprocessor`` each time.
+        """
+        return cls()
 
     def normalize_team_ids(self, df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
         """
@@ -52,27 +91,59 @@ class Preprocessor:
         df:
             Input dataframe to transform.
         columns:
-            Columns containing team abbreviations or IDs to normalize.
+            Columns containing team abbreviations or IDs to normalize; each is replaced by a new column.
         """
-        result = df.copy()
+        result = df.copy(deep=False)
         for col in columns:
             if col not in result.columns:
                 continue
-            result[col] = result[col].astype(str).str.upper().map(self._alias_map).fillna(result[col].astype(str).str.upper())
+            # Normalize each distinct identifier once and broadcast back through the factorized codes;
+            # missing entries keep their original NA value rather than becoming "NAN"/"<NA>" labels.
+            dtype = result[col].dtype
+            codes, uniques = pd.factorize(result[col])
+            labels = self._canonical_labels(pd.Series(uniques)).to_numpy(dtype=object)
+            normalized = np.empty(len(codes), dtype=object)
+            present = codes >= 0
+            normalized[present] = labels[codes[present]]
+            if not present.all():
+                normalized[~present] = result[col][~present].to_numpy(dtype=object)
+            # String-typed inputs (e.g. Arrow strings) keep their dtype; other columns become object labels.
+            result[col] = pd.array(normalized, dtype=dtype) if pd.api.types.is_string_dtype(dtype) else normalized
         return result
 
+    def _canonical_labels(self, values: pd.Series) -> pd.Series:
+        upper = values.astype(str).str.upper()
+        return upper.map(self._alias_map).fillna(upper)
+
     def attach_season(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
         """
         Add derived season metadata for a given game date column.
 
         Season convention used: if date month >= October (10), season year is that calendar year,
         else date belongs to previous year season (e.g., Jan 2015 => 2014 season).
+        Adds SEASON_YEAR (int16; nullable Int16 when some dates are missing) and SEASON_LABEL, and
+        replaces the date column with its parsed datetime form.
         """
-        result = df.copy()
-        result[date_column] = pd.to_datetime(result[date_column])
-        season_year = result[date_column].dt.year.where(result[date_column].dt.month >= 10, result[date_column].dt.year - 1)
+        result = df.copy(deep=False)
+        dates = pd.to_datetime(result[date_column])
+        result[date_column] = dates
+
+        # Month count since 1970-01 gives year and month in one integer pass; Jan-Sep belong to the
+        # season that started the previous calendar year.
+        months = dates.to_numpy(dtype="datetime64[ns]", na_value=np.datetime64("NaT")).astype("datetime64[M]")
+        missing = np.isnat(months)
+        months = months.astype(np.int64)
+        season_year = (months // 12 + 1970 - (months % 12 < 9)).astype(np.int16)
+
+        # Labels are formatted once per distinct season and broadcast back to the rows.
+        seasons, inverse = np.unique(season_year, return_inverse=True)
+        labels = np.array([f"{year}-{(year + 1) % 100:02d}" for year in seasons.tolist()], dtype=object)[inverse]
+        if missing.any():
+            season_year = pd.array(season_year, dtype="Int16")
+            season_year[missing] = pd.NA
+            labels[missing] = None
         result["SEASON_YEAR"] = season_year
-        result["SEASON_LABEL"] = season_year.astype(str) + "-" + (season_year + 1).astype(str).str[-2:]
+        result["SEASON_LABEL"] = labels
         return result
 
     def estimate_possessions(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -81,8 +152,10 @@ class Preprocessor:
 
         Formula (team level): 0.5 * ((FGA + 0.4 * FTA - 1.07 * (ORB / (ORB + DRB)) * (FGA - FG) + TOV) +
                                      (OppFGA + 0.4 * OppFTA - 1.07 * (OppORB / (OppORB + OppDRB)) * (OppFGA - OppFG) + OppTOV))
+
+        Only the EST_POSSESSIONS column is added; the input columns are shared with the result.
         """
-        result = df.copy()
+        result = df.copy(deep=False)
         required_cols = [
             "FGA",
             "FGM",
@@ -101,22 +174,49 @@ class Preprocessor:
         if missing_cols:
             raise ValueError(f"Cannot estimate possessions; missing columns: {missing_cols}")
 
-        orb_factor = result["OREB"] / (result["OREB"] + result["DREB"]).replace(0, pd.NA)
-        opp_orb_factor = result["OPP_OREB"] / (result["OPP_OREB"] + result["OPP_DREB"]).replace(0, pd.NA)
+        arrays = {col: result[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in required_cols}
+        # Both sides run through the same two scratch buffers and the team estimate is finished in
+        # place, so the whole formula allocates four arrays regardless of its term count.
+        n_rows = len(result)
+        scratch = (np.empty(n_rows), np.empty(n_rows))
+        possessions = _side_possessions(arrays, "", out=np.empty(n_rows), scratch=scratch)
+        possessions += _side_possessions(arrays, "OPP_", out=np.empty(n_rows), scratch=scratch)
+        possessions *= 0.5
 
-        team_possessions = result["FGA"] + 0.4 * result["FTA"] - 1.07 * orb_factor * (result["FGA"] - result["FGM"]) + result["TOV"]
-        opp_possessions = (
-            result["OPP_FGA"]
-            + 0.4 * result["OPP_FTA"]
-            - 1.07 * opp_orb_factor * (result["OPP_FGA"] - result["OPP_FGM"])
-            + result["OPP_TOV"]
-        )
-
-        result["EST_POSSESSIONS"] = 0.5 * (team_possessions + opp_possessions)
+        result["EST_POSSESSIONS"] = possessions
         return result
 
 
-def load_team_aliases(path: Optional[Path] = None) -> list[TeamAlias]:
+def _side_possessions(
+    arrays: dict[str, np.ndarray], prefix: str, *, out: np.ndarray, scratch: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """
+    Write one side's possession estimate into ``out`` using float64 box-score arrays.
+
+    Every step runs in place on ``out`` and the two ``scratch`` buffers. The result is NaN where
+    ORB + DRB is 0.
+    """
+    fga = arrays[f"{prefix}FGA"]
+    oreb = arrays[f"{prefix}OREB"]
+    orb_term, missed_fg = scratch
+
+    np.add(oreb, arrays[f"{prefix}DREB"], out=orb_term)
+    no_rebounds = orb_term == 0
+    np.divide(oreb, orb_term, out=orb_term, where=~no_rebounds)
+    orb_term[no_rebounds] = np.nan
+    orb_term *= 1.07
+    np.subtract(fga, arrays[f"{prefix}FGM"], out=missed_fg)
+    orb_term *= missed_fg
+
+    np.multiply(arrays[f"{prefix}FTA"], 0.4, out=out)
+    out += fga
+    out -= orb_term
+    out += arrays[f"{prefix}TOV"]
+    return out
+
+
+@lru_cache(maxsize=1)
+def load_team_aliases(path: Optional[Path] = None) -> tuple[TeamAlias, ...]:
     """
     Load team aliases from JSON configuration.
 
@@ -125,7 +225,37 @@ def load_team_aliases(path: Optional[Path] = None) -> list[TeamAlias]:
     path:
         Optional custom path; defaults to config/team_aliases.json alongside this module.
     """
+    return tuple(TeamAlias(**entry) for entry in _read_alias_entries(path))
+
+
+@lru_cache(maxsize=1)
+def load_alias_map(path: Optional[Path] = None) -> Mapping[str, str]:
+    """
+    Load team aliases as a read-only upper-case ``alias -> canonical id`` lookup.
+
+    Builds the mapping straight from the JSON entries, skipping the ``TeamAlias`` records.
+    """
+    return MappingProxyType(
+        {name.upper(): entry["canonical_id"].upper() for entry in _read_alias_entries(path) for name in entry["aliases"]}
+    )
+
+
+def _read_alias_entries(path: Optional[Path]) -> list[dict]:
     alias_path = path or DEFAULT_ALIAS_PATH
     with alias_path.open("r", encoding="utf-8") as fh:
-        raw_aliases = json.load(fh)
-    return [TeamAlias(**entry) for entry in raw_aliases]
+        return json.load(fh)
+
+
+def _alias_map_from_records(team_aliases: Iterable[TeamAlias]) -> dict[str, str]:
+    mapping = {}
+    for alias in team_aliases:
+        for name in alias.aliases:
+            mapping[name.upper()] = alias.canonical_id.upper()
+    return mapping
+
+
+def _records_from_alias_map(alias_map: Mapping[str, str]) -> list[TeamAlias]:
+    grouped: dict[str, list[str]] = {}
+    for alias, canonical_id in alias_map.items():
+        grouped.setdefault(canonical_id, []).append(alias)
+    return [TeamAlias(canonical_id=canonical_id, aliases=aliases) for canonical_id, aliases in grouped.items()]
@@ -6,15 +6,28 @@ from __future__ import annotations
 
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 
-def _format_identifier(row: pd.Series) -> str:
-    team = row.get("TEAM_ID", "UNKNOWN")
-    season = row.get("SEASON_YEAR", "N/A")
-    playoffs = row.get("IS_PLAYOFFS", False)
-    scope = "Playoffs" if playoffs else "Regular"
-    return f"{team} {season} ({scope})"
+def _format_identifiers(rows: pd.DataFrame) -> pd.Series:
+    playoffs = rows["IS_PLAYOFFS"].to_numpy(dtype=bool, na_value=False)
+    scope = np.where(playoffs, " (Playoffs)", " (Regular)").astype(object)
+    return rows["TEAM_ID"].astype(str) + " " + rows["SEASON_YEAR"].astype(str) + scope
+
+
+def _format_issues(
+    summary: pd.DataFrame,
+    mask: pd.Series | np.ndarray,
+    label: str,
+    values: np.ndarray,
+    *,
+    precision: int = 2,
+) -> list[str]:
+    """Render one ``"<label> for <team> <season> (<scope>): <value>"`` string per offending row."""
+    identifiers = _format_identifiers(summary.loc[mask, ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS"]])
+    formatted = np.char.mod(f"%.{precision}f", values[mask])
+    return (f"{label} for " + identifiers + ": " + formatted).tolist()
 
 
 def validate_team_summary(
@@ -36,41 +49,36 @@ def validate_team_summary(
     def _flag_out_of_bounds(column: str, bounds: tuple[float, float]) -> None:
         if column not in summary.columns:
             return
-        series = summary[column]
-        mask = series.notna() & ~series.between(bounds[0], bounds[1])
-        if mask.any():
-            offenders = summary.loc[mask, ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS", column]]
-            for _, row in offenders.iterrows():
-                ident = _format_identifier(row)
-                issues.append(f"{column} out of bounds for {ident}: {row[column]:.2f}")
+        values = summary[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        # fmin/fmax skip NaN, so an in-range column is cleared by two reductions without building a mask.
+        if not (np.fmin.reduce(values) < bounds[0] or np.fmax.reduce(values) > bounds[1]):
+            return
+        mask = (values < bounds[0]) | (values > bounds[1])
+        issues.extend(_format_issues(summary, mask, f"{column} out of bounds", values))
 
     _flag_out_of_bounds("PACE", pace_bounds)
     _flag_out_of_bounds("OFF_EFF_PER_100", efficiency_bounds)
     _flag_out_of_bounds("DEF_EFF_PER_100", efficiency_bounds)
 
     if "TOTAL_EST_POSSESSIONS" in summary.columns and "GAMES_PLAYED" in summary.columns:
-        avg_possessions = summary["TOTAL_EST_POSSESSIONS"] / summary["GAMES_PLAYED"].replace(0, pd.NA)
-        mask = avg_possessions.notna() & ~avg_possessions.between(possessions_bounds[0], possessions_bounds[1])
+        total_possessions = summary["TOTAL_EST_POSSESSIONS"].to_numpy(dtype=np.float64, na_value=np.nan)
+        games_played = summary["GAMES_PLAYED"].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Seasons without games get NaN, which fails both comparisons below and so is never flagged.
+        avg_possessions = np.divide(
+            total_possessions, games_played, out=np.full_like(total_possessions, np.nan), where=games_played != 0
+        )
+        mask = (avg_possessions < possessions_bounds[0]) | (avg_possessions > possessions_bounds[1])
         if mask.any():
-            offenders = summary.loc[mask, ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS"]].copy()
-            offenders["AVG_POSSESSIONS"] = avg_possessions[mask]
-            for _, row in offenders.iterrows():
-                ident = _format_identifier(row)
-                issues.append(f"Average possessions out of bounds for {ident}: {row['AVG_POSSESSIONS']:.2f}")
-        negative_mask = summary["TOTAL_EST_POSSESSIONS"] < 0
+            issues.extend(_format_issues(summary, mask, "Average possessions out of bounds", avg_possessions))
+        negative_mask = total_possessions < 0
         if negative_mask.any():
-            offenders = summary.loc[negative_mask, ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS", "TOTAL_EST_POSSESSIONS"]]
-            for _, row in offenders.iterrows():
-                ident = _format_identifier(row)
-                issues.append(f"Negative total possessions for {ident}: {row['TOTAL_EST_POSSESSIONS']:.2f}")
+            issues.extend(_format_issues(summary, negative_mask, "Negative total possessions", total_possessions))
 
     if "WIN_PCT" in summary.columns:
         mask = summary["WIN_PCT"].notna() & ~summary["WIN_PCT"].between(0, 1)
         if mask.any():
-            offenders = summary.loc[mask, ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS", "WIN_PCT"]]
-            for _, row in offenders.iterrows():
-                ident = _format_identifier(row)
-                issues.append(f"Win pct out of bounds for {ident}: {row['WIN_PCT']:.3f}")
+            win_pct = summary["WIN_PCT"].to_numpy(dtype=np.float64, na_value=np.nan)
+            issues.extend(_format_issues(summary, mask, "Win pct out of bounds", win_pct, precision=3))
 
     return issues
 
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from src.aggregation import aggregate_player_season, aggregate_team_season, make_group_codes
+
+
+def _team_games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "TEAM_ID": ["LAL", "BOS", "LAL", np.nan, "BOS", np.nan, "LAL"],
+            "SEASON_YEAR": [2020, 2020, 2019, 2020, 2020, 2020, 2020],
+            "IS_PLAYOFFS": [False, False, False, False, True, False, False],
+            "PACE": [100.0, 98.0, 97.0, 101.0, 95.0, 99.0, 102.0],
+            "EST_POSSESSIONS": [100.0, 98.0, 97.0, 0.0, 95.0, 0.0, 102.0],
+            "WIN": [1, 0, 1, 0, 1, 1, 0],
+        }
+    )
+
+
+def test_make_group_codes_numbers_groups_by_first_appearance_with_na_keys():
+    games = _team_games()
+    codes, uniques = make_group_codes(games, ["TEAM_ID", "SEASON_YEAR"])
+
+    assert codes.tolist() == [0, 1, 2, 3, 1, 3, 0]
+    assert uniques["TEAM_ID"].tolist()[:3] == ["LAL", "BOS", "LAL"]
+    assert pd.isna(uniques.loc[3, "TEAM_ID"])
+    assert uniques["SEASON_YEAR"].tolist() == [2020, 2020, 2019, 2020]
+
+
+def test_make_group_codes_does_not_overflow_with_many_wide_keys():
+    # Four keys with 65,537 uniques each; the last two rows would share one wrapped int64 key if the
+    # per-column codes were folded without re-factorizing.
+    n_uniques = 65_537
+    keys = pd.DataFrame({col: np.arange(n_uniques) for col in ("A", "B", "C", "D")})
+    colliding = pd.DataFrame({"A": [65_533, 0], "B": [6, 0], "C": [0, 4], "D": [1, 0]})
+    keys = pd.concat([keys, colliding], ignore_index=True)
+
+    codes, uniques = make_group_codes(keys, keys.columns)
+
+    assert len(uniques) == n_uniques + 2
+    assert codes[-2:].tolist() == [n_uniques, n_uniques + 1]
+
+
+def test_aggregate_team_season_matches_groupby_with_na_keys():
+    games = _team_games()
+    metrics = {"PACE": "mean", "EST_POSSESSIONS": "sum", "WIN": "mean"}
+    group_cols = ["TEAM_ID", "SEASON_YEAR", "IS_PLAYOFFS"]
+
+    result = aggregate_team_season(games, metrics=metrics)
+
+    grouped = games.groupby(group_cols, dropna=False)
+    expected = grouped.agg(metrics).reset_index()
+    expected = expected.merge(grouped.size().reset_index(name="GAMES_PLAYED"), on=group_cols, how="left")
+    expected = expected.rename(columns={"WIN": "WIN_PCT", "EST_POSSESSIONS": "TOTAL_EST_POSSESSIONS"})
+    expected["TOTAL_EST_POSSESSIONS"] = expected["TOTAL_EST_POSSESSIONS"].where(
+        expected["TOTAL_EST_POSSESSIONS"] != 0, pd.NA
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert pd.isna(result["TEAM_ID"].iloc[-1])
+    assert result["GAMES_PLAYED"].tolist() == [1, 1, 1, 2, 2]
+
+
+def test_aggregate_player_season_mixed_functions_match_dict_agg():
+    players = pd.DataFrame(
+        {
+            "PLAYER_ID": [1, 2, 1, np.nan, 2, np.nan],
+            "SEASON_YEAR": [2020, 2020, 2020, 2020, 2019, 2020],
+            "IS_PLAYOFFS": [False, False, False, False, False, False],
+            "MIN": [30.5, 12.0, 28.0, 5.0, 33.0, 7.5],
+            "PTS": [20, 4, 15, 2, 25, 3],
+            "FG_PCT": [0.5, 0.25, 0.4, np.nan, 0.55, 0.3],
+            "REB": [7, 2, 9, 1, 4, 0],
+        }
+    )
+    metrics = {"MIN": "sum", "FG_PCT": "mean", "PTS": "sum", "REB": "mean"}
+
+    result = aggregate_player_season(players, metrics=metrics)
+
+    expected = (
+        players.groupby(["PLAYER_ID", "SEASON_YEAR", "IS_PLAYOFFS"], dropna=False).agg(metrics).reset_index()
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(result.columns[3:]) == list(metrics)
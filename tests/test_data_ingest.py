@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.data_ingest import DataSourceConfig, NBADataIngestor
+
+
+def _game_rows() -> pd.DataFrame:
+    # GAME_ID suffixes: 001 regular season, 004 playoffs, 002 preseason, anything else other.
+    game_ids = ["0000001001", "0000002001", "0000003004", "0000004002", "0000005003", "0000006004"]
+    return pd.DataFrame(
+        {
+            "SEASON_ID": ["21919"] * len(game_ids),
+            "GAME_ID": game_ids,
+            "GAME_DATE": ["2020-01-0%d 00:00:00" % (i + 1) for i in range(len(game_ids))],
+            "TEAM_ID_HOME": [1610612747, 1610612738, 1610612747, 1610612738, 1610612747, 1610612738],
+            "TEAM_ABBREVIATION_HOME": ["LAL", "BOS", "LAL", "BOS", "LAL", "BOS"],
+            "PTS_HOME": [110.0, 99.0, 104.0, None, 120.0, 101.0],
+            "TEAM_ID_AWAY": [1610612738, 1610612747, 1610612738, 1610612747, 1610612738, 1610612747],
+            "TEAM_ABBREVIATION_AWAY": ["BOS", "LAL", "BOS", "LAL", "BOS", "LAL"],
+            "PTS_AWAY": [100.0, 101.0, 98.0, 95.0, 88.0, 97.0],
+        }
+    )
+
+
+@pytest.fixture
+def dataset(tmp_path) -> DataSourceConfig:
+    """A tiny dataset with the same 'game' table exported as CSV and as SQLite."""
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    games = _game_rows()
+    games.to_csv(csv_dir / "game.csv", index=False)
+    sqlite_path = tmp_path / "nba.sqlite"
+    with sqlite3.connect(sqlite_path) as conn:
+        games.to_sql("game", conn, index=False)
+        conn.execute("CREATE TABLE sparse (ID INTEGER, LABEL TEXT)")
+        conn.executemany("INSERT INTO sparse VALUES (?, ?)", [(None, None)] * 3 + [(7, "x")])
+    conn.close()
+    return DataSourceConfig(csv_dir=csv_dir, sqlite_path=sqlite_path)
+
+
+def test_sqlite_reads_infer_arrow_types_across_all_rows(dataset):
+    with NBADataIngestor(dataset) as ingestor:
+        sparse = ingestor.read_table("sparse")
+
+    assert sparse["ID"].dtype == "int64[pyarrow]"
+    assert sparse["LABEL"].dtype == "string[pyarrow]"
+    assert sparse["ID"].isna().sum() == 3
+
+
+def test_csv_parquet_cache_mirrors_raw_csv_schema(dataset):
+    with NBADataIngestor(dataset, prefer_sqlite=False) as ingestor:
+        first = ingestor.games()
+    cache_path = dataset.csv_dir.parent / "parquet_cache" / "game.parquet"
+
+    assert pq.read_schema(cache_path).names == list(_game_rows().columns)
+    with NBADataIngestor(dataset, prefer_sqlite=False) as ingestor:
+        assert list(ingestor.read_table("game").columns) == list(_game_rows().columns)
+        # Parquet has no second-resolution timestamps, so only the GAME_DATE unit may differ.
+        pd.testing.assert_frame_equal(ingestor.games(), first, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "scope, expected_types",
+    [
+        ({}, [0, 0, 1, 2, 3, 1]),
+        ({"regular_season_only": True}, [0, 0]),
+        ({"playoffs_only": True}, [1, 1]),
+    ],
+)
+def test_games_match_between_sqlite_and_csv_sources(dataset, scope, expected_types):
+    with NBADataIngestor(dataset, prefer_sqlite=True) as ingestor:
+        from_sqlite = ingestor.games(**scope)
+    with NBADataIngestor(dataset, prefer_sqlite=False) as ingestor:
+        from_csv = ingestor.games(**scope)
+
+    for games in (from_sqlite, from_csv):
+        assert games["GAME_TYPE"].dtype == "int8"
+        assert games["GAME_TYPE"].tolist() == expected_types
+        assert games["IS_REGULAR_SEASON"].tolist() == [code == 0 for code in expected_types]
+        assert games["IS_PLAYOFFS"].tolist() == [code == 1 for code in expected_types]
+        assert isinstance(games["TEAM_ID_HOME"].dtype, pd.CategoricalDtype)
+        assert games["TEAM_ID_HOME"].dtype == games["TEAM_ID_AWAY"].dtype
+
+    # The CSV reader types GAME_ID as an integer (dropping leading zeros); SQLite keeps the text.
+    assert pd.to_numeric(from_sqlite["GAME_ID"]).tolist() == from_csv["GAME_ID"].tolist()
+    for col in ("TEAM_ID_HOME", "TEAM_ID_AWAY", "TEAM_ABBREVIATION_HOME", "PTS_HOME", "PTS_AWAY"):
+        assert from_sqlite[col].tolist() == from_csv[col].tolist(), col
+
+
+def test_read_tables_reuses_pooled_read_only_connections(dataset):
+    with NBADataIngestor(dataset) as ingestor:
+        tables = ingestor.read_tables(["game", "sparse", "game"])
+        assert list(tables) == ["game", "sparse"]
+        assert len(tables["game"]) == len(_game_rows())
+
+        with ingestor._connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("CREATE TABLE scratch (ID INTEGER)")
+        with ingestor._connection() as again:
+            assert again is conn
+        assert ingestor.list_sqlite_tables() == ["game", "sparse"]
+    assert ingestor._idle_connections == []
+
+
+def test_games_falls_back_to_csv_after_a_single_sqlite_attempt(dataset, monkeypatch):
+    attempts = []
+
+    def failing_sqlite_read(self, table, **kwargs):
+        attempts.append(table)
+        raise sqlite3.OperationalError("no such table: game")
+
+    monkeypatch.setattr(NBADataIngestor, "_read_sqlite_table", failing_sqlite_read)
+    with NBADataIngestor(dataset) as ingestor:
+        games = ingestor.games(regular_season_only=True)
+
+    assert attempts == ["game"]
+    assert games["GAME_ID"].tolist() == [1001, 2001]
+    assert games["IS_REGULAR_SEASON"].all()
+
+
+def test_close_during_read_closes_borrowed_connection_on_return(dataset):
+    ingestor = NBADataIngestor(dataset)
+    borrowed, release = threading.Event(), threading.Event()
+    seen: list[sqlite3.Connection] = []
+
+    def read() -> None:
+        with ingestor._connection() as conn:
+            seen.append(conn)
+            borrowed.set()
+            release.wait(timeout=5)
+
+    worker = threading.Thread(target=read)
+    worker.start()
+    assert borrowed.wait(timeout=5)
+    ingestor.close()
+    release.set()
+    worker.join(timeout=5)
+
+    assert ingestor._idle_connections == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen[0].execute("SELECT 1")
+
+
+def test_missing_sqlite_table_falls_back_to_csv(dataset):
+    (dataset.csv_dir / "team_info_common.csv").write_text("TEAM_ID,team_city\n1610612747,Los Angeles\n")
+    with NBADataIngestor(dataset) as ingestor:
+        team_info = ingestor.team_info()
+    assert list(team_info.columns) == ["TEAM_ID", "TEAM_CITY"]
@@ -18,6 +18,15 @@ def test_annotate_era_adds_columns():
     assert annotated.loc[0, "ERA_KEY"] == "pace_and_space_rise"
 
 
+def test_annotate_era_handles_missing_and_out_of_range_years():
+    df = pd.DataFrame({"SEASON_YEAR": [1900, None, 2020]})
+    annotated = annotate_era(df)
+    assert annotated["ERA_KEY"].isna().tolist() == [True, True, False]
+    assert annotated.loc[2, "ERA_KEY"] == "modern_three_point"
+    assert annotated.loc[2, "ERA_START_YEAR"] == 2014
+    assert pd.isna(annotated.loc[2, "ERA_END_YEAR"])
+
+
 def test_summarize_by_era_weighted_average():
     df = pd.DataFrame(
         {
@@ -42,4 +51,25 @@ def test_summarize_by_era_weighted_average():
     # Weighted pace should be (100*10 + 110*20) / 30 = 106.666...
     assert abs(row["PACE"] - 106.6667) < 1e-3
     assert row["TOTAL_GAMES"] == 30
+    assert summary["TOTAL_GAMES"].dtype == "int64"
     assert pytest.approx(row["WEIGHTED_WIN_PCT"], rel=1e-3) == (0.5 * 10 + 0.75 * 20) / 30
+
+
+def test_summarize_by_era_matches_for_sorted_and_unsorted_input():
+    df = annotate_era(
+        pd.DataFrame(
+            {
+                "SEASON_YEAR": [2015, 1990, 2016, 1991, 2015],
+                "IS_PLAYOFFS": [False, False, True, False, False],
+                "GAMES_PLAYED": [82, 80, 10, 0, 82],
+                "PACE": [100.0, 95.0, 98.0, 90.0, None],
+                "WIN_PCT": [0.5, 0.4, 0.6, 0.1, 0.7],
+            }
+        )
+    )
+
+    unsorted_summary = summarize_by_era(df)
+    sorted_summary = summarize_by_era(df.sort_values(["ERA_START_YEAR", "IS_PLAYOFFS"]))
+
+    pd.testing.assert_frame_equal(unsorted_summary, sorted_summary)
+    assert unsorted_summary["TEAM_SEASONS"].tolist() == [2, 2, 1]
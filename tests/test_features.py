@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from src.features import (
+    compute_ball_security,
+    compute_efficiency,
+    compute_pace,
+    compute_shot_profile,
+    compute_team_game_features,
+)
+
+
+def _sample_games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "EST_POSSESSIONS": [100.0, 95.0],
+            "MINUTES_PLAYED": [48, 53],
+            "PTS": [110.0, 101.0],
+            "OPP_PTS": [104.0, 99.0],
+            "FGM": [40.0, 0.0],
+            "FGA": [85.0, 0.0],
+            "FG3M": [12.0, 0.0],
+            "FG3A": [33.0, 0.0],
+            "AST": [25.0, 0.0],
+            "TOV": [12.0, 0.0],
+        }
+    )
+
+
+def test_compute_team_game_features_matches_chained_helpers():
+    games = _sample_games()
+    chained = compute_pace(games, possessions_col="EST_POSSESSIONS", minutes_col="MINUTES_PLAYED")
+    chained = compute_efficiency(chained, points_col="PTS", possessions_col="EST_POSSESSIONS", prefix="OFF")
+    chained = compute_efficiency(chained, points_col="OPP_PTS", possessions_col="EST_POSSESSIONS", prefix="DEF")
+    chained = compute_shot_profile(chained, fgm_col="FGM", fga_col="FGA", fg3m_col="FG3M", fg3a_col="FG3A")
+    chained = compute_ball_security(chained, assists_col="AST", turnovers_col="TOV")
+
+    fused = compute_team_game_features(games)
+
+    pd.testing.assert_frame_equal(fused, chained)
+    assert list(games.columns) == list(_sample_games().columns)
+
+
+def test_shot_profile_and_ball_security_return_nan_for_zero_denominators():
+    features = compute_team_game_features(_sample_games())
+    zero_row = features.iloc[1]
+    for col in ("THREE_POINT_RATE", "THREE_POINT_SHARE_OF_PTS", "EFFECTIVE_FG_PCT", "AST_TOV_RATIO", "TURNOVER_PCT"):
+        assert pd.isna(zero_row[col])
+    assert features["THREE_POINT_RATE"].dtype == "float64"
+    assert abs(features.loc[0, "EFFECTIVE_FG_PCT"] - (40 + 6) / 85) < 1e-9
+
+
+def test_shot_profile_ratios_match_plain_division_exactly():
+    rng = np.random.default_rng(0)
+    fga = rng.integers(60, 110, size=1_000).astype(float)
+    fgm = np.floor(fga * rng.uniform(0.35, 0.55, size=fga.size))
+    fg3a = np.floor(fga * rng.uniform(0.1, 0.5, size=fga.size))
+    fg3m = np.floor(fg3a * rng.uniform(0.25, 0.45, size=fga.size))
+    games = pd.DataFrame({"FGM": fgm, "FGA": fga, "FG3M": fg3m, "FG3A": fg3a})
+
+    profile = compute_shot_profile(games, fgm_col="FGM", fga_col="FGA", fg3m_col="FG3M", fg3a_col="FG3A")
+
+    np.testing.assert_array_equal(profile["THREE_POINT_RATE"].to_numpy(), fg3a / fga)
+    np.testing.assert_array_equal(profile["EFFECTIVE_FG_PCT"].to_numpy(), (fgm + 0.5 * fg3m) / fga)
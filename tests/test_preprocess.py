@@ -0,0 +1,84 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.preprocess import Preprocessor, TeamAlias, load_team_aliases
+
+
+def _team_games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "TEAM_ABBREVIATION": ["njn", "LAL"],
+            "GAME_DATE": ["2015-01-10", "2015-11-02"],
+            "FGA": [85.0, 90.0],
+            "FGM": [40.0, 42.0],
+            "FTA": [20.0, 18.0],
+            "TOV": [12.0, 14.0],
+            "OREB": [10.0, 0.0],
+            "DREB": [30.0, 0.0],
+            "OPP_FGA": [80.0, 88.0],
+            "OPP_FGM": [38.0, 41.0],
+            "OPP_FTA": [22.0, 25.0],
+            "OPP_TOV": [15.0, 13.0],
+            "OPP_OREB": [9.0, 11.0],
+            "OPP_DREB": [33.0, 35.0],
+        }
+    )
+
+
+def test_preprocessor_transforms_leave_input_untouched():
+    games = _team_games()
+    preprocessor = Preprocessor()
+
+    result = preprocessor.normalize_team_ids(games, ["TEAM_ABBREVIATION"])
+    result = preprocessor.attach_season(result, "GAME_DATE")
+    result = preprocessor.estimate_possessions(result)
+
+    pd.testing.assert_frame_equal(games, _team_games())
+    assert result["SEASON_YEAR"].tolist() == [2014, 2015]
+    assert result["SEASON_LABEL"].tolist() == ["2014-15", "2015-16"]
+
+
+def test_estimate_possessions_matches_formula_and_is_nan_without_rebounds():
+    possessions = Preprocessor().estimate_possessions(_team_games())["EST_POSSESSIONS"]
+
+    team = 85 + 0.4 * 20 - 1.07 * (10 / 40) * (85 - 40) + 12
+    opp = 80 + 0.4 * 22 - 1.07 * (9 / 42) * (80 - 38) + 15
+    assert abs(possessions[0] - 0.5 * (team + opp)) < 1e-9
+    assert pd.isna(possessions[1])
+    assert possessions.dtype == "float64"
+
+
+def test_attach_season_parses_date_column():
+    result = Preprocessor().attach_season(_team_games(), "GAME_DATE")
+    assert result["GAME_DATE"].dtype.kind == "M"
+
+
+def test_team_aliases_keep_caller_records_and_loaded_records_are_immutable():
+    records = [TeamAlias(canonical_id="lal", aliases=["la lakers"])]
+    preprocessor = Preprocessor(team_aliases=records)
+    assert preprocessor.team_aliases == records
+    assert preprocessor.team_aliases[0].aliases == ("la lakers",)
+    assert preprocessor.normalize_team_ids(pd.DataFrame({"T": ["La Lakers"]}), ["T"])["T"].tolist() == ["LAL"]
+
+    preprocessor.team_aliases = []
+    assert preprocessor.team_aliases == []
+
+    assert Preprocessor().team_aliases == list(load_team_aliases())
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        load_team_aliases()[0].aliases = ()
+
+
+@pytest.mark.parametrize("dtype", [object, pd.ArrowDtype(pa.string())])
+def test_normalize_team_ids_keeps_missing_ids_missing(dtype):
+    teams = pd.DataFrame({"TEAM_ABBREVIATION": pd.Series(["njn", None, "LAL", np.nan], dtype=dtype)})
+
+    preprocessor = Preprocessor(alias_map={"NJN": "BKN"})
+    normalized = preprocessor.normalize_team_ids(teams, ["TEAM_ABBREVIATION"])["TEAM_ABBREVIATION"]
+
+    assert normalized.isna().tolist() == [False, True, False, True]
+    assert normalized[normalized.notna()].tolist() == ["BKN", "LAL"]
+    assert normalized.dtype == teams["TEAM_ABBREVIATION"].dtype
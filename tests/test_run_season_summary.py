@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.data_ingest import DataSourceConfig
+from src.pipeline.run_season_summary import load_cached_summary, store_cached_summary, summary_cache_key
+
+
+def _fake_ingestor(tmp_path, *, prefer_sqlite: bool = True) -> SimpleNamespace:
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir(exist_ok=True)
+    (csv_dir / "game.csv").write_text("GAME_ID\n0000001001\n")
+    (tmp_path / "nba.sqlite").write_bytes(b"")
+    config = DataSourceConfig(csv_dir=csv_dir, sqlite_path=tmp_path / "nba.sqlite")
+    return SimpleNamespace(source_config=config, prefer_sqlite=prefer_sqlite)
+
+
+def test_summary_cache_key_tracks_scope_source_and_config(tmp_path, monkeypatch):
+    ingestor = _fake_ingestor(tmp_path)
+    era_config = tmp_path / "era_segments.json"
+    era_config.write_text("[]")
+
+    def key(source=ingestor, **overrides):
+        kwargs = {"playoffs_only": False, "regular_season_only": False, "config_paths": [era_config], **overrides}
+        return summary_cache_key(source, **kwargs)
+
+    base = key()
+    assert key() == base
+    assert key(playoffs_only=True) != base
+    assert key(_fake_ingestor(tmp_path, prefer_sqlite=False)) != base
+
+    era_config.write_text('[{"key": "modern"}]')
+    edited = key()
+    assert edited != base
+
+    monkeypatch.setattr("src.pipeline.run_season_summary.SUMMARY_CACHE_VERSION", -1)
+    assert key() != edited
+
+
+def test_cached_summary_round_trips_through_parquet(tmp_path):
+    cache_dir = tmp_path / "cache"
+    assert load_cached_summary(cache_dir, "abc") is None
+
+    summary = pd.DataFrame({"TEAM_ID": ["LAL"], "SEASON_YEAR": [2020], "PACE": [99.5]})
+    era_summary = pd.DataFrame({"ERA_KEY": ["modern"], "TOTAL_GAMES": [82]})
+    store_cached_summary(cache_dir, "abc", summary, era_summary)
+
+    loaded_summary, loaded_era = load_cached_summary(cache_dir, "abc")
+    pd.testing.assert_frame_equal(loaded_summary, summary)
+    pd.testing.assert_frame_equal(loaded_era, era_summary)
+    assert load_cached_summary(cache_dir, "other") is None
@@ -0,0 +1,112 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.pipeline.season_summary import (
+    _FEATURE_CACHE,
+    _FEATURE_CACHE_SIZE,
+    _OPPONENT_SIDE_COLUMNS,
+    _TEAM_SIDE_COLUMNS,
+    _reshape_games_to_long,
+    build_team_game_features,
+    write_summary_outputs,
+)
+from src.preprocess import Preprocessor
+
+
+def _wide_games(home_matchups: list[str]) -> pd.DataFrame:
+    n_games = len(home_matchups)
+    data = {
+        "GAME_ID": [f"00{i:08d}" for i in range(n_games)],
+        "SEASON_ID": ["22020"] * n_games,
+        "SEASON_TYPE": ["Regular Season"] * n_games,
+        "IS_REGULAR_SEASON": [True] * n_games,
+        "IS_PLAYOFFS": [False] * n_games,
+        "GAME_DATE": pd.to_datetime(["2021-01-05"] * n_games),
+    }
+    for side, matchups, result in (("HOME", home_matchups, "W"), ("AWAY", home_matchups, "L")):
+        for col in set(_TEAM_SIDE_COLUMNS) | set(_OPPONENT_SIDE_COLUMNS):
+            data[f"{col}_{side}"] = [10] * n_games
+        data[f"TEAM_ABBREVIATION_{side}"] = ["LAL" if side == "HOME" else "BOS"] * n_games
+        data[f"MATCHUP_{side}"] = matchups
+        data[f"WL_{side}"] = [result] * n_games
+    return pd.DataFrame(data)
+
+
+def test_reshape_games_to_long_parses_overtime_and_results():
+    games = _wide_games(["LAL vs. BOS", "LAL vs. BOS OT", "LAL vs. BOS OT2", "LAL vs. BOS OTx"])
+    long = _reshape_games_to_long(games)
+
+    assert len(long) == 2 * len(games)
+    assert long["OVERTIME_PERIODS"].tolist() == [0, 1, 2, 1] * 2
+    assert long["WIN"].tolist() == [1] * 4 + [0] * 4
+    assert long["IS_HOME"].tolist() == [True] * 4 + [False] * 4
+    assert long.loc[0, "OPP_TEAM_ABBREVIATION"] == "BOS"
+    for col in ("TEAM_ABBREVIATION", "MATCHUP", "WL", "OPP_TEAM_ABBREVIATION"):
+        assert isinstance(long[col].dtype, pd.ArrowDtype)
+    assert long["PTS"].dtype == pd.ArrowDtype(pa.int16())
+
+
+def test_write_summary_outputs_supports_parquet_and_csv(tmp_path):
+    summary = pd.DataFrame({"TEAM_ID": ["LAL", "BOS"], "SEASON_YEAR": [2020, 2020], "PACE": [99.5, 101.25]})
+    era_summary = pd.DataFrame({"ERA_KEY": ["modern"], "PACE": [100.375]})
+
+    team_path, era_path = write_summary_outputs(summary, era_summary, output_dir=tmp_path, tag="all")
+    assert (team_path.name, era_path.name) == ("team_season_all.parquet", "team_era_all.parquet")
+    pd.testing.assert_frame_equal(pd.read_parquet(team_path), summary)
+
+    team_csv, _ = write_summary_outputs(summary, era_summary, output_dir=tmp_path, tag="all", output_format="csv")
+    assert team_csv.suffix == ".csv"
+    pd.testing.assert_frame_equal(pd.read_csv(team_csv), summary)
+
+    with pytest.raises(ValueError):
+        write_summary_outputs(summary, era_summary, output_dir=tmp_path, tag="all", output_format="feather")
+
+
+class _CountingIngestor:
+    def __init__(self, games: pd.DataFrame) -> None:
+        self._games = games
+        self.calls = 0
+
+    def games(self, *, playoffs_only: bool = False, regular_season_only: bool = False) -> pd.DataFrame:
+        self.calls += 1
+        return self._games
+
+
+def test_build_team_game_features_memoizes_per_ingestor_and_scope():
+    ingestor = _CountingIngestor(_wide_games(["LAL vs. BOS", "LAL vs. BOS OT"]))
+
+    first = build_team_game_features(ingestor)
+    first["SCRATCH"] = 1
+    second = build_team_game_features(ingestor)
+    assert ingestor.calls == 1
+    assert "SCRATCH" not in second.columns
+    pd.testing.assert_frame_equal(second, first.drop(columns="SCRATCH"))
+
+    build_team_game_features(ingestor, regular_season_only=True)
+    assert ingestor.calls == 2
+
+
+def test_build_team_game_features_evicts_least_recently_used_entry():
+    ingestor = _CountingIngestor(_wide_games(["LAL vs. BOS"]))
+    preprocessors = [Preprocessor(alias_map={}) for _ in range(_FEATURE_CACHE_SIZE + 1)]
+
+    for preprocessor in preprocessors[:-1]:
+        build_team_game_features(ingestor, preprocessor)
+    build_team_game_features(ingestor, preprocessors[0])
+    build_team_game_features(ingestor, preprocessors[-1])
+    assert ingestor.calls == _FEATURE_CACHE_SIZE + 1
+    assert len(_FEATURE_CACHE[ingestor]) == _FEATURE_CACHE_SIZE
+
+    build_team_game_features(ingestor, preprocessors[0])
+    assert ingestor.calls == _FEATURE_CACHE_SIZE + 1
+    build_team_game_features(ingestor, preprocessors[1])
+    assert ingestor.calls == _FEATURE_CACHE_SIZE + 2
+
+
+def test_build_team_game_features_keeps_arrow_team_abbreviations():
+    features = build_team_game_features(_CountingIngestor(_wide_games(["LAL vs. BOS"])))
+
+    for col in ("TEAM_ABBREVIATION", "OPP_TEAM_ABBREVIATION"):
+        assert features[col].dtype == pd.ArrowDtype(pa.string())
+    assert features["TEAM_ABBREVIATION"].tolist() == ["LAL", "BOS"]
@@ -48,6 +48,27 @@ def test_validate_team_summary_flags_out_of_bounds_values():
     assert len(issues) >= 3
 
 
+def test_validate_team_summary_formats_each_offending_row():
+    df = pd.DataFrame(
+        {
+            "TEAM_ID": ["LAL", "BOS", "NYK"],
+            "SEASON_YEAR": [2020, 2021, 2022],
+            "IS_PLAYOFFS": [False, True, False],
+            "PACE": [30.0, 100.0, 200.0],
+            "TOTAL_EST_POSSESSIONS": [100.0, -5.0, 8000.0],
+            "WIN_PCT": [0.5, 0.5, -0.1234],
+            "GAMES_PLAYED": [1, 0, 82],
+        }
+    )
+
+    assert validate_team_summary(df) == [
+        "PACE out of bounds for LAL 2020 (Regular): 30.00",
+        "PACE out of bounds for NYK 2022 (Regular): 200.00",
+        "Negative total possessions for BOS 2021 (Playoffs): -5.00",
+        "Win pct out of bounds for NYK 2022 (Regular): -0.123",
+    ]
+
+
 def test_assert_team_summary_valid_runs_pipeline_when_data_available():
     try:
         ingestor = NBADataIngestor()